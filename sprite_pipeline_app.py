@@ -1,7 +1,11 @@
+import functools
+import hashlib
 import json
 import math
 import os
 import re
+import shutil
+import struct
 import subprocess
 import sys
 import tempfile
@@ -9,11 +13,14 @@ import time
 import threading
 import zipfile
 import importlib.util
-from collections import deque
-from dataclasses import dataclass, field
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
@@ -22,16 +29,35 @@ from tkinter import filedialog, messagebox, ttk
 def _ensure_runtime_dependencies() -> None:
     required = [
         ("Pillow", "PIL"),
+        ("numpy", "numpy"),
         ("tkinterdnd2", "tkinterdnd2"),
     ]
     missing = [(pip_name, module_name) for pip_name, module_name in required if importlib.util.find_spec(module_name) is None]
     if not missing:
         return
 
-    root = tk.Tk()
-    root.withdraw()
     pip_names = [pip_name for pip_name, _module_name in missing]
     human = ", ".join(pip_names)
+    cmd = [sys.executable, "-m", "pip", "install"] + pip_names
+    auto_install = bool(os.environ.get("SPRITE_PIPELINE_AUTO_INSTALL"))
+    if auto_install or (sys.stdin is not None and sys.stdin.isatty()):
+        # Console launch or unattended setup: install from the terminal and
+        # skip bringing up Tcl/Tk just to show dialogs.
+        if not auto_install:
+            try:
+                answer = input(f"Missing required libraries: {human}\nInstall now with pip? [y/N] ")
+            except EOFError:
+                answer = ""
+            if answer.strip().lower() not in ("y", "yes"):
+                raise SystemExit(f"Cannot launch without required dependencies: {human}")
+        print(f"Installing: {human}", file=sys.stderr)
+        if subprocess.run(cmd).returncode != 0:
+            raise SystemExit("Dependency installation failed")
+        importlib.invalidate_caches()
+        return
+
+    root = tk.Tk()
+    root.withdraw()
     should_install = messagebox.askyesno(
         "Missing Dependencies",
         (
@@ -44,7 +70,6 @@ def _ensure_runtime_dependencies() -> None:
         root.destroy()
         raise SystemExit(f"Cannot launch without required dependencies: {human}")
 
-    cmd = [sys.executable, "-m", "pip", "install"] + pip_names
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0:
         details = (result.stderr or result.stdout or "").strip()
@@ -69,9 +94,15 @@ def _ensure_runtime_dependencies() -> None:
 
 _ensure_runtime_dependencies()
 
+import numpy as np
 from PIL import Image, ImageOps, ImageTk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
+try:
+    import orjson
+except ImportError:  # Optional, faster metadata.json parsing.
+    orjson = None
+
 BaseTk = TkinterDnD.Tk
 
 
@@ -80,11 +111,47 @@ DEFAULT_TARGET_SPAN_2X2 = 1080.0
 FIXED_PADDING_PX = 32
 PREVIEW_MIN_ZOOM = 0.08
 PREVIEW_MAX_ZOOM_FALLBACK = 64.0
+# Total size of the whole-sprite preview resamples kept around for panning.
+PREVIEW_SCALED_CACHE_MAX_BYTES = 64 * 1024 * 1024
+PREVIEW_BG = "#1c1c1c"
+PREVIEW_BG_RGB = (0x1C, 0x1C, 0x1C)
 EXPORT_ALPHA_TRIM_THRESHOLD = 12
 EXPORT_BOUNDS_ALPHA_THRESHOLD = 32
 AUTO_SIDE_TRANSPARENCY_PX = 15
 AUTO_EDGE_OPAQUE_RUN_PX = 10
 EDGE_ALIGN_ALPHA_THRESHOLD = EXPORT_ALPHA_TRIM_THRESHOLD
+def _default_rgba_cache_dir() -> Optional[Path]:
+    # Set SPRITE_PIPELINE_NO_RGBA_CACHE to turn the decoded-pixel cache off.
+    if os.environ.get("SPRITE_PIPELINE_NO_RGBA_CACHE"):
+        return None
+    if os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "sprite_pipeline" / "rgba"
+
+
+RGBA_CACHE_DIR = _default_rgba_cache_dir()
+# Decoded sources are 4 bytes per pixel; least recently used files are
+# evicted once the cache grows past this.
+RGBA_CACHE_MAX_BYTES = 2 * 1024 ** 3
+BULK_TREE_COLUMNS = ("id", "name", "category", "theme", "variant_options", "manufacturer", "source", "location")
+BULK_EDIT_FIELDS = (
+    ("id", "ID"),
+    ("name", "Name"),
+    ("set_id", "Set ID"),
+    ("category", "Category"),
+    ("theme", "Theme"),
+    ("tiles_x", "Tiles X"),
+    ("tiles_y", "Tiles Y"),
+    ("variant_group", "Variant Group"),
+    ("variant_label", "Variant Label"),
+    ("group_label", "Group Label"),
+    ("manufacturer", "Manufacturer"),
+    ("link", "Link"),
+    ("instructions", "Instructions"),
+    ("notes", "Notes"),
+)
 
 # Keep in sync with the legacy metadata utility.
 CATEGORY_OPTIONS = [
@@ -145,6 +212,13 @@ _CATEGORY_ALIAS_MAP = {
 
 _THEME_ALIAS_MAP = {theme.lower(): theme for theme in THEME_OPTIONS}
 
+# Single lookup table for category normalization; explicit aliases win over
+# the lowercased option names, matching the original lookup order.
+_CATEGORY_NORMALIZE = {
+    **{category.lower(): category for category in CATEGORY_OPTIONS},
+    **_CATEGORY_ALIAS_MAP,
+}
+
 FIT_MODE_PRESETS = {
     "1x1": 538.0,
     "1x2": 810.0,
@@ -155,16 +229,46 @@ FIT_MODE_PRESETS = {
 }
 
 
+_ID_STRIP_RE = re.compile(r"[^a-z0-9\s_-]+")
+# ASCII-only equivalent of _ID_STRIP_RE as a single str.translate pass.
+_ID_STRIP_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(c for c in map(chr, range(128)) if not (c in "abcdefghijklmnopqrstuvwxyz0123456789_-" or c.isspace())),
+)
+_ID_WS_RE = re.compile(r"\s+")
+_ID_UNDER_RE = re.compile(r"_+")
+_ID_EDGE_RE = re.compile(r"^-+|_+$")
+# Single-editor offset field names -> (offsets key, axis index).
+_OFFSET_KEY_MAP = {f"offset_{idx}_{axis}": (str(idx), axis_idx) for idx in range(4) for axis_idx, axis in enumerate("xy")}
+# Partial numbers a user may type into an offset field ("", "-", "1.", ".5").
+_FLOAT_FRAGMENT_RE = re.compile(r"-?\d*\.?\d*")
+# What json.dumps(ensure_ascii=True) writes as \uXXXX escapes (DEL included).
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7e]")
+
+
 def _normalize_id(value: str) -> str:
     value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9\s_-]+", "", value)
-    value = re.sub(r"\s+", "_", value)
-    value = re.sub(r"_+", "_", value)
-    value = re.sub(r"^-+|_+$", "", value)
+    if value.isascii():
+        value = value.translate(_ID_STRIP_TABLE)
+    else:
+        value = _ID_STRIP_RE.sub("", value)
+    value = _ID_WS_RE.sub("_", value)
+    value = _ID_UNDER_RE.sub("_", value)
+    value = _ID_EDGE_RE.sub("", value)
     return value or "model"
 
 
 def _safe_int(value: str, default: int) -> int:
+    # Clean digits and blank fields are the common cases; settle them without
+    # going through int()'s exception path. isdecimal (not isdigit) so that
+    # e.g. superscripts still fall through to int() and fail as before.
+    if isinstance(value, str):
+        text = value.strip()
+        if text.isdecimal():
+            return int(text)
+        if not text:
+            return default
     try:
         return int(value)
     except Exception:
@@ -172,12 +276,27 @@ def _safe_int(value: str, default: int) -> int:
 
 
 def _safe_float(value: str, default: float) -> float:
+    if isinstance(value, str) and not value.strip():
+        return default
     try:
         return float(value)
     except Exception:
         return default
 
 
+def _is_float_fragment(text: str) -> bool:
+    return _FLOAT_FRAGMENT_RE.fullmatch(text) is not None
+
+
+def _parse_offset(raw: str, default: float) -> float:
+    # Offset entries only accept _is_float_fragment input, so float() either
+    # parses it or the field holds a blank/partial number.
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
 def _round_half_up(value: float) -> int:
     # Deterministic rounding (avoids Python's banker's rounding at .5).
     if value >= 0:
@@ -189,28 +308,96 @@ def _normalize_category(value: str) -> str:
     raw = value.strip()
     if raw == "":
         return DEFAULT_CATEGORY
-    key = raw.lower().replace("-", " ").replace("_", " ")
-    key = re.sub(r"\s+", " ", key).strip()
-    if key in _CATEGORY_ALIAS_MAP:
-        return _CATEGORY_ALIAS_MAP[key]
-    for category in CATEGORY_OPTIONS:
-        if key == category.lower():
-            return category
-    return raw
+    key = " ".join(raw.lower().replace("-", " ").replace("_", " ").split())
+    return _CATEGORY_NORMALIZE.get(key, raw)
 
 
 def _normalize_theme(value: str) -> str:
     raw = value.strip()
     if raw == "":
         return ""
-    key = raw.lower().replace("-", " ").replace("_", " ")
-    key = re.sub(r"\s+", " ", key).strip()
-    if key in _THEME_ALIAS_MAP:
-        return _THEME_ALIAS_MAP[key]
-    for theme in THEME_OPTIONS:
-        if key == theme.lower():
-            return theme
-    return raw
+    key = " ".join(raw.lower().replace("-", " ").replace("_", " ").split())
+    return _THEME_ALIAS_MAP.get(key, raw)
+
+
+def _json_loads(payload: bytes) -> object:
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN literals); keep stdlib leniency.
+            pass
+    return json.loads(payload)
+
+
+def _escape_non_ascii_char(match: "re.Match[str]") -> str:
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u%04x" % code
+
+
+# json.dumps builds a fresh encoder per call when given options; the
+# settings never change, so the fallback path shares one.
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=True)
+
+
+def _orjson_floats_match(obj: object) -> bool:
+    # orjson writes NaN and +/-Infinity as null, so documents holding them
+    # must take the stdlib path or a save would lose those values. Finite
+    # floats get the same shortest digits as repr(), but orjson never uses
+    # repr's exponent form (1e-05 -> 0.00001, 1e+16 -> 1e16); only floats
+    # repr writes in fixed notation come out byte-identical.
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if value != 0.0 and not 1e-4 <= abs(value) < 1e16:
+                return False
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return True
+
+
+def _encode_json_bytes(obj: object) -> bytes:
+    # Byte-identical to json.dumps(indent=2, ensure_ascii=True), which the
+    # unchanged-metadata checks rely on. orjson emits raw UTF-8, so non-ASCII
+    # text is escaped afterwards the way ensure_ascii does; floats orjson
+    # formats differently and anything it can't encode take the stdlib path.
+    if orjson is not None and _orjson_floats_match(obj):
+        try:
+            payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            payload = b""
+        if payload:
+            if payload.isascii() and b"\x7f" not in payload:
+                return payload
+            return _NON_ASCII_RE.sub(_escape_non_ascii_char, payload.decode("utf-8")).encode("ascii")
+    # ensure_ascii output is pure ASCII, so the cheaper codec is exact.
+    return _JSON_ENCODER.encode(obj).encode("ascii")
+
+
+def _dump_json(obj: object, path: Path) -> None:
+    # Text mode keeps the platform newline translation of the old json.dump writes.
+    path.write_text(_encode_json_bytes(obj).decode("ascii"), encoding="utf-8")
+
+
+def _write_json_atomic(path: Path, data: object) -> None:
+    # For edits of existing metadata: write a sibling temp file in one go and
+    # rename it over the original, so a crash never leaves a truncated file.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        _dump_json(data, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except Exception:
+                pass
 
 
 def _split_multi_values(raw: str) -> list[str]:
@@ -259,6 +446,10 @@ def _metadata_multi_to_text(value: object, *, kind: str) -> str:
     return _join_multi_values(parts)
 
 
+def _bulk_scan_sort_key(entry: dict) -> tuple[str, str, str]:
+    return (entry["id"].lower(), entry["name"].lower(), entry["location"].lower())
+
+
 def _encode_multi_metadata(raw: str, *, kind: str, default: str = "") -> object:
     values: list[str]
     if kind == "category":
@@ -291,6 +482,226 @@ def _metadata_multi_to_list(value: object, *, kind: str, default_when_empty: boo
     return _dedupe_preserve_case([item for item in raw_values if item.strip()])
 
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _fast_png_size(path: str) -> tuple[int, int]:
+    # IHDR is always the first chunk, so width/height sit at bytes 16-24.
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if len(header) == 24 and header[:8] == _PNG_SIGNATURE and header[12:16] == b"IHDR":
+        w, h = struct.unpack(">II", header[16:24])
+        return int(w), int(h)
+    with Image.open(path) as img:
+        return img.size
+
+
+def _rgba_cache_prefix(source_path: str) -> str:
+    return hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()
+
+
+_RGBA_CACHE_WRITER: Optional[ThreadPoolExecutor] = None
+_RGBA_CACHE_WRITER_LOCK = threading.Lock()
+
+
+def _load_rgba(source_path: str) -> Image.Image:
+    # Decoded pixels are cached as raw .npy arrays so later sessions can read
+    # them straight from disk instead of inflating the PNG again. The file
+    # name carries mtime/size, so edited sources miss and get re-cached.
+    cache_path: Optional[Path] = None
+    if RGBA_CACHE_DIR is not None:
+        try:
+            st = os.stat(source_path)
+            cache_path = RGBA_CACHE_DIR / f"{_rgba_cache_prefix(source_path)}-{st.st_mtime_ns}-{st.st_size}.npy"
+        except OSError:
+            cache_path = None
+    if cache_path is not None and cache_path.exists():
+        try:
+            # Read, not memory-mapped: a mapped file cannot be deleted on
+            # Windows, which would keep eviction from ever freeing it.
+            arr = np.load(cache_path)
+            if arr.ndim == 3 and arr.shape[2] == 4 and arr.dtype == np.uint8:
+                h, w = arr.shape[:2]
+                try:
+                    # The file's mtime is its last use for LRU eviction.
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                return Image.frombuffer("RGBA", (w, h), arr, "raw", "RGBA", 0, 1)
+        except Exception:
+            pass
+
+    with Image.open(source_path) as img:
+        rgba = img.convert("RGBA")
+    if cache_path is not None:
+        _submit_rgba_cache_write(cache_path, rgba)
+    return rgba
+
+
+def _submit_rgba_cache_write(cache_path: Path, rgba: Image.Image) -> None:
+    # Loads run on the UI thread during ingest; the .npy write and the cache
+    # trim happen on a single background writer instead.
+    global _RGBA_CACHE_WRITER
+    with _RGBA_CACHE_WRITER_LOCK:
+        if _RGBA_CACHE_WRITER is None:
+            _RGBA_CACHE_WRITER = ThreadPoolExecutor(max_workers=1)
+        _RGBA_CACHE_WRITER.submit(_store_rgba_cache, cache_path, rgba)
+
+
+def _store_rgba_cache(cache_path: Path, rgba: Image.Image) -> None:
+    prefix = cache_path.name.split("-", 1)[0]
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob(f"{prefix}-*.npy"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+        # The UI process and export workers may cache the same source at
+        # once, so every writer gets its own temp file.
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(rgba, dtype=np.uint8))
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        _trim_rgba_cache(cache_path)
+    except Exception:
+        pass
+
+
+def _trim_rgba_cache(keep: Path) -> None:
+    # Evict least recently used .npy files until the cache fits its budget.
+    files: list[tuple[int, int, str]] = []
+    total = 0
+    with os.scandir(keep.parent) as it:
+        for dir_entry in it:
+            if not dir_entry.name.endswith(".npy"):
+                continue
+            try:
+                st = dir_entry.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime_ns, st.st_size, dir_entry.path))
+            total += st.st_size
+    if total <= RGBA_CACHE_MAX_BYTES:
+        return
+    files.sort()
+    keep_path = str(keep)
+    for _mtime, size, path in files:
+        if total <= RGBA_CACHE_MAX_BYTES:
+            break
+        if path == keep_path:
+            continue
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+
+
+class AlphaGeo(NamedTuple):
+    # Opaque-pixel geometry of one sprite, shared by the auto-align passes.
+    # mask/row_left/row_right/row_present cover only the opaque bounding box
+    # (rows top_y..bottom_y, columns left_x..right_x).
+    height: int
+    top_y: int
+    bottom_y: int
+    left_x: int
+    right_x: int
+    mask: np.ndarray
+    row_left: np.ndarray
+    row_right: np.ndarray
+    row_present: np.ndarray
+
+
+def _compute_alpha_geometry(alpha: np.ndarray, threshold: int) -> Optional[AlphaGeo]:
+    h, w = alpha.shape
+    if w <= 0 or h <= 0:
+        return None
+    opaque_rows = np.flatnonzero(alpha.max(axis=1) >= threshold)
+    if opaque_rows.size == 0:
+        return None
+    top_y = int(opaque_rows[0])
+    bottom_y = int(opaque_rows[-1])
+    opaque_cols = np.flatnonzero(alpha.max(axis=0) >= threshold)
+    left_x = int(opaque_cols[0])
+    right_x = int(opaque_cols[-1])
+
+    # Only the opaque bounding box needs a mask; everything outside it
+    # is transparent by construction.
+    mask = alpha[top_y:bottom_y + 1, left_x:right_x + 1] >= threshold
+    box_h = mask.shape[0]
+    row_left = mask.argmax(axis=1) + left_x
+    row_right = right_x - mask[:, ::-1].argmax(axis=1)
+    row_present = mask.any(axis=1)
+    return AlphaGeo(h, top_y, bottom_y, left_x, right_x, mask, row_left, row_right, row_present)
+
+
+def _resample_from_mips(
+    source: Image.Image,
+    mips: list[Image.Image],
+    zoom: float,
+    box: tuple[float, float, float, float],
+    size: tuple[int, int],
+    resample: int,
+) -> Image.Image:
+    # Filtered preview resample of a source box (full-resolution coordinates).
+    # The source is premultiplied once per item, so the resampler no longer
+    # converts every crop itself. Zoomed out past 1/2, resample from the mip
+    # level at or just above the display scale, built on first use until it
+    # drops under 128px wide.
+    if not mips:
+        mips.append(source.convert("RGBa"))
+    lod = 0
+    if zoom < 0.5:
+        want = int(math.floor(-math.log2(zoom)))
+        while len(mips) <= want:
+            if mips[-1].width < 128:
+                break
+            mips.append(mips[-1].reduce(2))
+        lod = min(want, len(mips) - 1)
+    level = mips[lod]
+    f = float(1 << lod)
+    lvl_x0, lvl_y0, lvl_x1, lvl_y1 = (v / f for v in box)
+    lvl_w, lvl_h = level.size
+    # Crop to whole level pixels around the box so the reduce/resize below
+    # only read the visible part of the level.
+    crop_l = max(0, min(lvl_w - 1, int(math.floor(lvl_x0))))
+    crop_t = max(0, min(lvl_h - 1, int(math.floor(lvl_y0))))
+    crop_r = max(crop_l + 1, min(lvl_w, int(math.ceil(lvl_x1))))
+    crop_b = max(crop_t + 1, min(lvl_h, int(math.ceil(lvl_y1))))
+    # Still far below the level's scale (small sprites stop early): integer
+    # box reduce of the crop first, so the filter pass reads ~k^2 fewer pixels.
+    lvl_zoom = zoom * f
+    k = max(1, int(1.0 / lvl_zoom / 2.0)) if lvl_zoom < 0.5 else 1
+    if k > 1:
+        crop = level.reduce(k, box=(crop_l, crop_t, crop_r, crop_b))
+    else:
+        crop = level.crop((crop_l, crop_t, crop_r, crop_b))
+    preview = crop.resize(
+        size,
+        resample,
+        box=(
+            (lvl_x0 - crop_l) / k,
+            (lvl_y0 - crop_t) / k,
+            (lvl_x1 - crop_l) / k,
+            (lvl_y1 - crop_t) / k,
+        ),
+    )
+    return preview.convert("RGBA")
+
+
+# Fields that feed measured_span/effective_target_span; assigning any of them
+# drops the memoized spans.
+_SPAN_INPUT_FIELDS = frozenset(("guide_left", "guide_right", "fit_mode", "target_span_px"))
+
+
 @dataclass
 class SpriteImageItem:
     source_path: str
@@ -305,11 +716,19 @@ class SpriteImageItem:
     width: int = 0
     height: int = 0
     _source_rgba: Optional[Image.Image] = None
+    _alpha_np: Optional[np.ndarray] = None
+    _mip_levels: Optional[list[Image.Image]] = None
+    _scaled_previews: Optional[dict[tuple[int, int, int], Image.Image]] = None
+    _span_cache: Optional[tuple[float, float]] = None
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in _SPAN_INPUT_FIELDS:
+            object.__setattr__(self, "_span_cache", None)
+        object.__setattr__(self, name, value)
 
     @classmethod
     def from_path(cls, source_path: str) -> "SpriteImageItem":
-        with Image.open(source_path) as img:
-            w, h = img.size
+        w, h = _fast_png_size(source_path)
         center = w * 0.5
         span = min(DEFAULT_TARGET_SPAN_2X2, float(w))
         left = max(0.0, center - span * 0.5)
@@ -326,22 +745,49 @@ class SpriteImageItem:
 
     def source_rgba(self) -> Image.Image:
         if self._source_rgba is None:
-            with Image.open(self.source_path) as img:
-                self._source_rgba = img.convert("RGBA")
+            self._source_rgba = _load_rgba(self.source_path)
             self.width, self.height = self._source_rgba.size
         return self._source_rgba
 
+    def mip_levels(self) -> list[Image.Image]:
+        # Premultiplied (RGBa) copies of the source for filtered preview
+        # resampling: level 0 is full size, level n is 1/2^n. Only the preview
+        # worker appends to it, on first use of each level.
+        if self._mip_levels is None:
+            self._mip_levels = []
+        return self._mip_levels
+
+    def scaled_previews(self) -> dict[tuple[int, int, int], Image.Image]:
+        # Whole-sprite preview resamples by (width, height, resample). The
+        # preview worker fills it within PREVIEW_SCALED_CACHE_MAX_BYTES across
+        # all items; the app clears it when the item is removed.
+        if self._scaled_previews is None:
+            self._scaled_previews = {}
+        return self._scaled_previews
+
+    def alpha_array(self) -> np.ndarray:
+        if self._alpha_np is None:
+            self._alpha_np = np.asarray(self.source_rgba().getchannel("A"), dtype=np.uint8)
+        return self._alpha_np
+
+    def _spans(self) -> tuple[float, float]:
+        spans = self._span_cache
+        if spans is None:
+            preset = FIT_MODE_PRESETS.get(self.fit_mode, None)
+            target = preset if preset is not None else max(1.0, self.target_span_px)
+            spans = (max(1.0, self.guide_right - self.guide_left), target)
+            self._span_cache = spans
+        return spans
+
     def measured_span(self) -> float:
-        return max(1.0, self.guide_right - self.guide_left)
+        return self._spans()[0]
 
     def effective_target_span(self) -> float:
-        preset = FIT_MODE_PRESETS.get(self.fit_mode, None)
-        if preset is not None:
-            return preset
-        return max(1.0, self.target_span_px)
+        return self._spans()[1]
 
     def scale_factor(self) -> float:
-        return self.effective_target_span() / self.measured_span()
+        measured, target = self._spans()
+        return target / measured
 
     def label(self) -> str:
         return Path(self.source_path).name
@@ -394,6 +840,430 @@ class PackMetadata:
         }
 
 
+def _solve_scaled_width(width: int, measured_span: float, target_span: float, nominal_sw: int) -> int:
+    # Smallest width within nominal_sw +/- 128 whose scaled span rounds to the
+    # target span, else the closest miss. The rounded span never decreases as
+    # the width grows, so the first hit sits next to the closed-form estimate
+    # and only a few widths around it need testing.
+    target_span_i = int(round(target_span))
+    src_w = float(max(1, width))
+    lo = max(1, nominal_sw - 128)
+    hi = max(1, nominal_sw + 128)
+
+    def span_i(cand_sw: int) -> int:
+        return int(round(measured_span * (float(cand_sw) / src_w)))
+
+    est = (target_span_i - 0.5) * src_w / measured_span
+    cand_sw = min(hi, max(lo, math.ceil(est)))
+    while cand_sw > lo and span_i(cand_sw - 1) >= target_span_i:
+        cand_sw -= 1
+    while cand_sw < hi and span_i(cand_sw) < target_span_i:
+        cand_sw += 1
+    if span_i(cand_sw) == target_span_i:
+        return cand_sw
+
+    best_sw = nominal_sw
+    best_err = float("inf")
+    for dsw in range(-128, 129):
+        cand_sw = max(1, nominal_sw + dsw)
+        cand_span = measured_span * (float(cand_sw) / src_w)
+        err = abs(int(round(cand_span)) - target_span_i) * 1000.0 + abs(cand_span - target_span)
+        if err < best_err:
+            best_err = err
+            best_sw = cand_sw
+    return best_sw
+
+
+def _export_sprite_image(item: SpriteImageItem) -> Image.Image:
+    src = item.source_rgba()
+    target_span = max(1.0, item.effective_target_span())
+    measured_span = max(1e-6, item.measured_span())
+    target_span_i = int(round(target_span))
+
+    # Strict guide-driven solve: choose integer width that makes the
+    # scaled guide span land exactly on target integer pixels when possible.
+    nominal_sw = max(1, _round_half_up(item.width * (target_span / measured_span)))
+    sw = max(1, _solve_scaled_width(item.width, measured_span, target_span, nominal_sw))
+    scale_x = float(sw) / float(max(1, item.width))
+    scale_y = scale_x
+    sh = max(1, _round_half_up(item.height * scale_y))
+    if (sw, sh) == src.size:
+        # Guides already measure the target span: resize() would only copy.
+        scaled = src
+    else:
+        # BICUBIC for upscales and downscales down to 1/2 scale (Photoshop-like
+        # edge stability); below 1/2 bicubic visibly softens the edges, so
+        # LANCZOS takes over there.
+        if scale_x >= 0.5:
+            resample = Image.Resampling.BICUBIC
+        else:
+            resample = Image.Resampling.LANCZOS
+        scaled = src.resize((sw, sh), resample)
+
+    # Match Photoshop action behavior by using actual sprite pixel bounds,
+    # not the full canvas size, when computing output dimensions.
+    # Ignore very faint antialias fringe when computing bounds so
+    # bottom alignment matches Photoshop-like visual edges.
+    alpha = np.asarray(scaled.getchannel("A"), dtype=np.uint8)
+    # Use a tighter threshold for bounds so tiny AA fringe does not inflate width.
+    # Row/column maxima give the same box as getbbox() on a thresholded mask.
+    opaque_cols = np.flatnonzero(alpha.max(axis=0) >= EXPORT_BOUNDS_ALPHA_THRESHOLD)
+    if opaque_cols.size == 0:
+        alpha_left = 0.0
+        alpha_top = 0.0
+        alpha_right = float(sw)
+        alpha_bottom = float(sh)
+    else:
+        opaque_rows = np.flatnonzero(alpha.max(axis=1) >= EXPORT_BOUNDS_ALPHA_THRESHOLD)
+        alpha_left = float(opaque_cols[0])
+        alpha_top = float(opaque_rows[0])
+        alpha_right = float(opaque_cols[-1] + 1)
+        alpha_bottom = float(opaque_rows[-1] + 1)
+
+    center_scaled = item.guide_center * scale_x
+    baseline_scaled = item.baseline_y * scale_y
+
+    dist_left = max(0.0, center_scaled - alpha_left)
+    dist_right = max(0.0, alpha_right - center_scaled)
+    half_w = max(dist_left, dist_right) + FIXED_PADDING_PX
+    out_w = max(1, int(math.ceil(half_w * 2.0)))
+    # Keep center anchor on an exact pixel to prevent 1px L/R wobble.
+    if out_w % 2 != 0:
+        out_w += 1
+
+    # Vertical rule: 32px top padding, 0px bottom padding.
+    # Visible sprite bounds must touch the output bottom edge.
+    alpha_h = max(1.0, alpha_bottom - alpha_top)
+    out_h = max(1, int(math.ceil(alpha_h + FIXED_PADDING_PX)))
+
+    paste_x = _round_half_up(out_w * 0.5 - center_scaled)
+    paste_y = _round_half_up(out_h - alpha_bottom)
+    out = Image.new("RGBA", (out_w, out_h), (0, 0, 0, 0))
+    # Over a transparent canvas source-over is a plain copy of every pixel
+    # with any alpha, and leaves (0, 0, 0, 0) elsewhere; a masked paste does
+    # exactly that without alpha_composite's blending maths.
+    out.paste(scaled, (paste_x, paste_y), Image.fromarray(alpha > 0))
+    return out
+
+
+def _zip_info_like(info: zipfile.ZipInfo, compress_type: int) -> zipfile.ZipInfo:
+    target = zipfile.ZipInfo(info.filename, info.date_time)
+    target.compress_type = compress_type
+    target.comment = info.comment
+    target.extra = info.extra
+    target.create_system = info.create_system
+    target.external_attr = info.external_attr
+    target.internal_attr = info.internal_attr
+    return target
+
+
+def _rewritten_member_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    # A rebuilt nested zip whose original deflate saved less than 10% (its
+    # PNGs/WebPs are already compressed) is stored instead: deflating it
+    # again costs the most CPU of the whole rewrite for next to no gain.
+    if (
+        info.compress_type != zipfile.ZIP_STORED
+        and info.file_size > 0
+        and info.compress_size * 10 >= info.file_size * 9
+    ):
+        return _zip_info_like(info, zipfile.ZIP_STORED)
+    return info
+
+
+def _metadata_compress_type(payload: bytes) -> int:
+    # Small JSON is stored, since deflate's framing eats most of the gain
+    # below a few hundred bytes.
+    return zipfile.ZIP_DEFLATED if len(payload) > 256 else zipfile.ZIP_STORED
+
+
+def _metadata_member_info(info: zipfile.ZipInfo, payload: bytes) -> zipfile.ZipInfo:
+    # The replaced metadata.json gets a fresh ZipInfo.
+    return _zip_info_like(info, _metadata_compress_type(payload))
+
+
+def _copy_zip_member(src_zip: zipfile.ZipFile, dst_zip: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    # Copy an untouched member across. Normally its compressed bytes are moved
+    # verbatim (no inflate/deflate); zip64-sized members fall back to
+    # streaming through the codec in chunks. Either way the copied ZipInfo
+    # keeps name, timestamp, attributes and compression method.
+    if info.is_dir():
+        dst_zip.writestr(info, b"")
+        return
+    if (
+        info.file_size < zipfile.ZIP64_LIMIT
+        and info.compress_size < zipfile.ZIP64_LIMIT
+        and info.header_offset < zipfile.ZIP64_LIMIT
+        and _raw_copy_zip_member(src_zip, dst_zip, info)
+    ):
+        return
+    target = _zip_info_like(info, info.compress_type)
+    with src_zip.open(info, "r") as src, dst_zip.open(
+        target, "w", force_zip64=info.file_size >= zipfile.ZIP64_LIMIT
+    ) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+
+# ZipFile internals the raw copy writes through; not public API, so the
+# copy falls back to streaming if a Python version drops any of them.
+_ZIPFILE_RAW_COPY_ATTRS = ("_writing", "_lock", "_seekable", "_didModify", "start_dir", "filelist", "NameToInfo")
+
+
+def _raw_copy_zip_member(src_zip: zipfile.ZipFile, dst_zip: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+    # Writes a fresh local header (sizes and CRC inline, no data descriptor)
+    # followed by the member's compressed bytes copied straight from the
+    # source file. Returns False, having written nothing, if the source local
+    # header doesn't look right or the member is encrypted: with a data
+    # descriptor the encryption header's check byte comes from the DOS time,
+    # so clearing that flag would make readers reject the password.
+    if not all(hasattr(dst_zip, attr) for attr in _ZIPFILE_RAW_COPY_ATTRS):
+        return False
+    src_fp = src_zip.fp
+    dst_fp = dst_zip.fp
+    if src_fp is None or dst_fp is None or dst_zip._writing or info.flag_bits & 0x1:
+        return False
+    src_fp.seek(info.header_offset)
+    header = src_fp.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        return False
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src_fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+
+    target = zipfile.ZipInfo(info.filename, info.date_time)
+    target.compress_type = info.compress_type
+    target.comment = info.comment
+    target.extra = info.extra
+    target.create_system = info.create_system
+    target.create_version = info.create_version
+    target.extract_version = info.extract_version
+    target.external_attr = info.external_attr
+    target.internal_attr = info.internal_attr
+    target.flag_bits = info.flag_bits & ~0x08
+    target.CRC = info.CRC
+    target.compress_size = info.compress_size
+    target.file_size = info.file_size
+    with dst_zip._lock:
+        if dst_zip._seekable:
+            dst_fp.seek(dst_zip.start_dir)
+        target.header_offset = dst_fp.tell()
+        dst_zip._didModify = True
+        dst_fp.write(target.FileHeader(False))
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = src_fp.read(min(remaining, 1 << 20))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {info.filename!r}")
+            dst_fp.write(chunk)
+            remaining -= len(chunk)
+        dst_zip.filelist.append(target)
+        dst_zip.NameToInfo[target.filename] = target
+        dst_zip.start_dir = dst_fp.tell()
+    return True
+
+
+def _presized_zip_buffer(src_zip: zipfile.ZipFile) -> BytesIO:
+    # BytesIO grows by only ~1/8 per resize, so rebuilding a large nested zip
+    # into an empty one copies it many times over. Allocate roughly the
+    # rebuilt size up front (local + central headers, data, end record) and
+    # rewind; the caller truncate()s at the final position once done.
+    size = 22
+    for info in src_zip.infolist():
+        size += 76 + 2 * (len(info.filename) + len(info.extra)) + len(info.comment) + info.compress_size
+    buffer = BytesIO()
+    buffer.seek(size - 1)
+    buffer.write(b"\0")
+    buffer.seek(0)
+    return buffer
+
+
+_ENCODE_BUFFERS = threading.local()
+
+
+def _encode_image_bytes(image: Image.Image, ext: str, save_kwargs: dict) -> bytes:
+    # Export workers encode sprite after sprite, so each thread keeps one
+    # buffer and overwrites it in place instead of regrowing a fresh one;
+    # only the written prefix is copied out (truncate() would free it).
+    b = getattr(_ENCODE_BUFFERS, "buffer", None)
+    if b is None:
+        b = _ENCODE_BUFFERS.buffer = BytesIO()
+    b.seek(0)
+    image.save(b, format="WEBP" if ext == "webp" else "PNG", **save_kwargs)
+    size = b.tell()
+    with b.getbuffer() as view:
+        return bytes(view[:size])
+
+
+def _encode_export_thumbnail(out: Image.Image, ext: str, save_kwargs: dict) -> bytes:
+    # Integer box-reduce first (premultiplied, so transparent pixels do
+    # not darken the edges); LANCZOS then only covers the remaining
+    # fractional step on a far smaller image.
+    k = max(1, min(out.width // 256, out.height // 256))
+    if k > 1:
+        pre = out.convert("RGBa").reduce(k)
+        thumb = ImageOps.contain(pre, (256, 256), Image.Resampling.LANCZOS).convert("RGBA")
+    else:
+        thumb = ImageOps.contain(out, (256, 256), Image.Resampling.LANCZOS)
+    return _encode_image_bytes(thumb, ext, save_kwargs)
+
+
+def _export_job_worker(job: dict) -> list[tuple[str, bytes]]:
+    # Runs in a worker process: scale/composite/encode one sprite and hand the
+    # encoded bytes back so the UI process only does the file/zip writes.
+    ext = job["ext"]
+    out = _export_sprite_image(job["item"])
+    if job["index"] != 1:
+        return [(f"{job['index']}.{ext}", _encode_image_bytes(out, ext, job["save_kwargs"]))]
+    # The first sprite also yields the thumbnail; the encoders release the
+    # GIL, so it is built and encoded alongside the full-size encode.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        thumb_future = pool.submit(_encode_export_thumbnail, out, ext, job["save_kwargs"])
+        data = _encode_image_bytes(out, ext, job["save_kwargs"])
+        thumb_data = thumb_future.result()
+    return [(f"{job['index']}.{ext}", data), (f"thumb.{ext}", thumb_data)]
+
+
+_LEGEND_X_PATH = (
+    "M365.865,366.891l-16.144-27.977c-6.574-10.702-10.702-17.642-14.646-24.965h-0.375"
+    "c-3.57,7.323-7.132,14.08-13.706,25.149l-15.211,27.793H287.01l38.678-64.026l-37.173-62.527"
+    "h18.957l16.71,29.674c4.701,8.255,8.263,14.646,11.642,21.403h0.566c3.57-7.506,6.757-13.331,"
+    "11.451-21.403l17.275-29.674h18.774l-38.487,61.595l39.427,64.958H365.865z"
+)
+_LEGEND_Y_PATH = (
+    "M730.689,366.891V313.2l-39.993-72.862h18.59l17.826,34.933c4.892,9.57,8.638,17.275,"
+    "12.582,26.096h0.382c3.562-8.271,7.889-16.526,12.765-26.096l18.208-34.933h18.59L747.2,313.001v53.89"
+    "H730.689z"
+)
+# Outline diamond and the green "+" marker, in legend source coordinates.
+_LEGEND_DIAMOND_POINTS = np.array(
+    [(1084.669, 258.213), (544.669, 514.213), (4.669, 258.213), (544.669, 2.213)],
+    dtype=np.float64,
+)
+_LEGEND_PLUS_POINTS = np.array(
+    [
+        (602.166, 406.897), (562.16, 406.897), (562.16, 366.891), (527.178, 366.891),
+        (527.178, 406.897), (487.172, 406.897), (487.172, 441.879), (527.178, 441.879),
+        (527.178, 481.885), (562.16, 481.885), (562.16, 441.879), (602.166, 441.879),
+    ],
+    dtype=np.float64,
+)
+
+
+_SVG_TOKEN_RE = re.compile(r"(?P<cmd>[A-Za-z])|(?P<num>-?\d*\.?\d+)")
+_BEZ_BASES: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def _bezier_bases(steps: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Cubic Bernstein weights at t = 1/steps .. 1, multiplied in the same order
+    # as the scalar formula so evaluated points come out bit-identical.
+    bases = _BEZ_BASES.get(steps)
+    if bases is None:
+        t = np.arange(1, steps + 1, dtype=np.float64) / float(steps)
+        mt = 1.0 - t
+        bases = (mt * mt * mt, 3.0 * mt * mt * t, 3.0 * mt * t * t, t * t * t)
+        _BEZ_BASES[steps] = bases
+    return bases
+
+
+@functools.lru_cache(maxsize=8)
+def _svg_path_to_points(path_d: str, curve_steps: int = 10) -> tuple[tuple[float, float], ...]:
+    # Cached: the legend paths are constants, so each is parsed once per process.
+    # Commands stay str, numbers are converted up front, so the parser tells
+    # them apart by type instead of re-matching every token.
+    tokens: list[object] = [
+        m.group() if m.lastgroup == "cmd" else float(m.group()) for m in _SVG_TOKEN_RE.finditer(path_d)
+    ]
+    i = 0
+    cmd = ""
+    cx = 0.0
+    cy = 0.0
+    sx = 0.0
+    sy = 0.0
+    out: list[tuple[float, float]] = []
+
+    def cubic(p0, p1, p2, p3, steps: int) -> list[tuple[float, float]]:
+        b0, b1, b2, b3 = _bezier_bases(steps)
+        xs = b0 * p0[0] + b1 * p1[0] + b2 * p2[0] + b3 * p3[0]
+        ys = b0 * p0[1] + b1 * p1[1] + b2 * p2[1] + b3 * p3[1]
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok.__class__ is str:
+            cmd = tok
+            i += 1
+        if cmd == "":
+            break
+        if cmd == "M":
+            if i + 1 >= len(tokens):
+                break
+            cx = tokens[i]; cy = tokens[i + 1]; i += 2
+            sx, sy = cx, cy
+            out.append((cx, cy))
+            cmd = "L"
+        elif cmd == "m":
+            if i + 1 >= len(tokens):
+                break
+            cx += tokens[i]; cy += tokens[i + 1]; i += 2
+            sx, sy = cx, cy
+            out.append((cx, cy))
+            cmd = "l"
+        elif cmd == "L":
+            while i + 1 < len(tokens) and tokens[i].__class__ is float and tokens[i + 1].__class__ is float:
+                cx = tokens[i]; cy = tokens[i + 1]; i += 2
+                out.append((cx, cy))
+        elif cmd == "l":
+            while i + 1 < len(tokens) and tokens[i].__class__ is float and tokens[i + 1].__class__ is float:
+                cx += tokens[i]; cy += tokens[i + 1]; i += 2
+                out.append((cx, cy))
+        elif cmd == "H":
+            while i < len(tokens) and tokens[i].__class__ is float:
+                cx = tokens[i]; i += 1
+                out.append((cx, cy))
+        elif cmd == "h":
+            while i < len(tokens) and tokens[i].__class__ is float:
+                cx += tokens[i]; i += 1
+                out.append((cx, cy))
+        elif cmd == "V":
+            while i < len(tokens) and tokens[i].__class__ is float:
+                cy = tokens[i]; i += 1
+                out.append((cx, cy))
+        elif cmd == "v":
+            while i < len(tokens) and tokens[i].__class__ is float:
+                cy += tokens[i]; i += 1
+                out.append((cx, cy))
+        elif cmd == "C":
+            while i + 5 < len(tokens) and all(tok.__class__ is float for tok in tokens[i:i + 6]):
+                p0 = (cx, cy)
+                p1 = (tokens[i], tokens[i + 1])
+                p2 = (tokens[i + 2], tokens[i + 3])
+                p3 = (tokens[i + 4], tokens[i + 5])
+                i += 6
+                out.extend(cubic(p0, p1, p2, p3, curve_steps))
+                cx, cy = p3
+        elif cmd == "c":
+            while i + 5 < len(tokens) and all(tok.__class__ is float for tok in tokens[i:i + 6]):
+                p0 = (cx, cy)
+                p1 = (cx + tokens[i], cy + tokens[i + 1])
+                p2 = (cx + tokens[i + 2], cy + tokens[i + 3])
+                p3 = (cx + tokens[i + 4], cy + tokens[i + 5])
+                i += 6
+                out.extend(cubic(p0, p1, p2, p3, curve_steps))
+                cx, cy = p3
+        elif cmd in ("Z", "z"):
+            out.append((sx, sy))
+        else:
+            i += 1
+    return tuple(out)
+
+
+@functools.lru_cache(maxsize=8)
+def _svg_path_array(path_d: str, curve_steps: int = 10) -> np.ndarray:
+    # (N, 2) float64 view of the parsed points, built once so a redraw is a
+    # single affine op on the array.
+    pts = np.asarray(_svg_path_to_points(path_d, curve_steps), dtype=np.float64).reshape(-1, 2)
+    pts.flags.writeable = False
+    return pts
+
+
 class SpritePipelineApp(BaseTk):
     def __init__(self) -> None:
         super().__init__()
@@ -402,6 +1272,11 @@ class SpritePipelineApp(BaseTk):
         self.minsize(960, 680)
 
         self.items: list[SpriteImageItem] = []
+        # normcase'd source paths of self.items, kept in step with it.
+        self._item_paths: set[str] = set()
+        # Auto-aligned (center, left, right, baseline) per source path,
+        # validated by mtime/size so re-aligning skips the alpha scans.
+        self._auto_guides_cache: dict[str, tuple[int, int, Optional[tuple[float, float, float, float]]]] = {}
         self.active_idx: Optional[int] = None
         self.pack_meta = PackMetadata()
 
@@ -409,9 +1284,20 @@ class SpritePipelineApp(BaseTk):
         self.pan_x: float = 0.0
         self.pan_y: float = 0.0
         self.drag_mode: Optional[str] = None
+        # Item under the current drag gesture, fixed from press to release.
+        self._drag_item: Optional[SpriteImageItem] = None
         self.preview_photo: Optional[ImageTk.PhotoImage] = None
-        self._render_pending = False
-        self._fps_times: deque[float] = deque(maxlen=90)
+        self._preview_photo_image: Optional[Image.Image] = None
+        # ImageTk.PhotoImage.width()/height() keep the size it was built with,
+        # so the live Tk image size is tracked here once it is resized.
+        self._preview_photo_size = (0, 0)
+        self._preview_dirty = False
+        # Ring buffer of the last 90 frame timestamps; FPS is derived from the
+        # newest/oldest pair so each frame is O(1) with no allocation.
+        self._fps_times: list[float] = [0.0] * 90
+        self._fps_index = 0
+        self._fps_count = 0
+        self._fps_label_time = 0.0
         self._fps_text = tk.StringVar(value="FPS: --")
         self._preview_lock = threading.Lock()
         self._preview_event = threading.Event()
@@ -429,8 +1315,10 @@ class SpritePipelineApp(BaseTk):
         self._canvas_left_id: Optional[int] = None
         self._canvas_center_id: Optional[int] = None
         self._canvas_right_id: Optional[int] = None
-        self._zoom_render_after_id: Optional[str] = None
-        self._pan_render_after_id: Optional[str] = None
+        # Scene items (tag "scene") are created on the first frame and then only
+        # moved; they are hidden, not deleted, while the "Add PNGs" hint shows.
+        self._canvas_hint_id: Optional[int] = None
+        self._scene_visible = False
         self._last_canvas_mouse: tuple[float, float] = (0.0, 0.0)
         self._suppress_image_apply = False
         self._multi_value_memory: dict[str, list[str]] = {}
@@ -441,6 +1329,12 @@ class SpritePipelineApp(BaseTk):
         self.export_format_var = tk.StringVar(value="webp")
         self.webp_quality_var = tk.StringVar(value="95")
         self.webp_lossless_var = tk.BooleanVar(value=False)
+        self.webp_max_compression_var = tk.BooleanVar(value=False)
+        self.png_compress_level_var = tk.StringVar(value="1")
+        self._export_futures: Optional[list] = None
+        # Worker processes are started on the first export and kept for the
+        # session, so later exports skip interpreter/numpy/PIL start-up.
+        self._export_pool: Optional[ProcessPoolExecutor] = None
         self.append_metadata_name_var = tk.BooleanVar(value=True)
         self.zip_name_var = tk.StringVar(value="sprite_pack.zip")
         self._last_auto_zip_name = self.zip_name_var.get().strip() or "sprite_pack.zip"
@@ -483,6 +1377,29 @@ class SpritePipelineApp(BaseTk):
         self.bulk_apply_status_var = tk.StringVar(value="")
         self.bulk_entries: list[dict] = []
         self.bulk_entry_by_iid: dict[str, dict] = {}
+        self.bulk_idx_by_entry_id: dict[int, int] = {}
+        self._bulk_select_after_id: Optional[str] = None
+        # Entry whose metadata the single-row editor currently shows.
+        self._bulk_editor_entry: Optional[dict] = None
+        # Folder rows are listed straight from the walk and their summaries are
+        # read afterwards on _bulk_summary_pool, visible rows first.
+        self._bulk_summary_pool: Optional[ThreadPoolExecutor] = None
+        self._bulk_summary_queue: list[dict] = []
+        self._bulk_summary_queue_pos = 0
+        self._bulk_summary_submitted: set[int] = set()
+        self._bulk_summary_inflight = 0
+        self._bulk_summary_results: list[tuple[int, dict, Optional[dict]]] = []
+        self._bulk_scan_order_pending = False
+        # True from the start of a scan until every summary is read; header
+        # sorting waits for it, since unread rows would sort on blank keys.
+        self._bulk_loading = False
+        # Normalized sort keys per column, aligned with bulk_entries order.
+        self._bulk_sort_keys: dict[str, list[str]] = {}
+        # Rows are inserted into bulk_tree progressively: the first screenful
+        # synchronously, the rest in after() chunks (see _bulk_fill_tree).
+        self._bulk_tree_rows: list[tuple[str, tuple]] = []
+        self._bulk_tree_filled = 0
+        self._bulk_tree_generation = 0
         self.bulk_field_vars: dict[str, tk.StringVar] = {}
         self.bulk_apply_vars: dict[str, tk.BooleanVar] = {}
         self.bulk_multi_mode_vars: dict[str, tk.StringVar] = {}
@@ -493,6 +1410,14 @@ class SpritePipelineApp(BaseTk):
         self.bulk_single_vars: dict[str, tk.StringVar] = {}
         self.bulk_single_inputs: dict[str, tk.Widget] = {}
         self.bulk_single_status_var = tk.StringVar(value="Select one row to edit a single metadata file.")
+        self._bulk_scan_lock = threading.Lock()
+        self._bulk_scan_generation = 0
+        self._metadata_cache: dict[str, tuple[int, int, dict]] = {}
+        # Open archives and inflated nested-zip bytes reused across single
+        # edits/bulk reads; keyed by path and validated by mtime/size.
+        self._zip_cache_lock = threading.Lock()
+        self._zip_handle_cache: dict[str, tuple[int, int, zipfile.ZipFile]] = {}
+        self._nested_zip_cache: dict[tuple[str, tuple[str, ...]], tuple[int, int, bytes]] = {}
 
         self._build_ui()
         self._sync_zip_name_to_id(force=True)
@@ -574,12 +1499,25 @@ class SpritePipelineApp(BaseTk):
         ).grid(row=2, column=1, sticky="w")
         ttk.Label(export, text="Zip Name").grid(row=3, column=0, sticky="w", pady=2)
         ttk.Entry(export, textvariable=self.zip_name_var, width=24).grid(row=3, column=1, sticky="ew")
+        ttk.Label(export, text="PNG Compression").grid(row=4, column=0, sticky="w", pady=2)
+        ttk.Combobox(
+            export,
+            values=[str(level) for level in range(10)],
+            textvariable=self.png_compress_level_var,
+            state="readonly",
+            width=12,
+        ).grid(row=4, column=1, sticky="w")
+        ttk.Checkbutton(
+            export,
+            text="WebP Max Compression (slow)",
+            variable=self.webp_max_compression_var,
+        ).grid(row=5, column=0, columnspan=2, sticky="w")
         ttk.Button(left, text="Export Pack Folder", command=self._export_folder).pack(fill="x", pady=(10, 4))
         ttk.Button(left, text="Export Pack Zip", command=self._export_zip).pack(fill="x")
         ttk.Button(left, text="Export Metadata Only", command=self._export_metadata_only).pack(fill="x", pady=(6, 0))
 
         # Center panel: preview.
-        self.canvas = tk.Canvas(center, bg="#1c1c1c", highlightthickness=1, highlightbackground="#4a4a4a")
+        self.canvas = tk.Canvas(center, bg=PREVIEW_BG, highlightthickness=1, highlightbackground="#4a4a4a")
         self.canvas.grid(row=0, column=0, sticky="nsew")
         self.canvas.bind("<Configure>", lambda _e: self._request_render())
         self.canvas.bind("<ButtonPress-1>", self._on_canvas_press)
@@ -736,7 +1674,7 @@ class SpritePipelineApp(BaseTk):
 
         self.bulk_tree = ttk.Treeview(
             list_frame,
-            columns=("id", "name", "category", "theme", "variant_options", "manufacturer", "source", "location"),
+            columns=BULK_TREE_COLUMNS,
             show="headings",
             selectmode="extended",
         )
@@ -838,6 +1776,7 @@ class SpritePipelineApp(BaseTk):
 
         single_offsets_frame = ttk.LabelFrame(single_frame, text="Per-Rotation Offsets")
         single_offsets_frame.grid(row=len(single_fields), column=0, columnspan=2, sticky="ew", pady=(6, 0))
+        offset_vcmd = (self.register(_is_float_fragment), "%P")
         for idx in range(4):
             self.bulk_single_vars[f"offset_{idx}_x"] = tk.StringVar(value="0")
             self.bulk_single_vars[f"offset_{idx}_y"] = tk.StringVar(value="0")
@@ -845,10 +1784,22 @@ class SpritePipelineApp(BaseTk):
             row.pack(fill="x", pady=1)
             ttk.Label(row, text=f"Offset {idx}", width=10).pack(side="left")
             ttk.Label(row, text="X").pack(side="left")
-            ex = ttk.Entry(row, textvariable=self.bulk_single_vars[f"offset_{idx}_x"], width=8)
+            ex = ttk.Entry(
+                row,
+                textvariable=self.bulk_single_vars[f"offset_{idx}_x"],
+                width=8,
+                validate="key",
+                validatecommand=offset_vcmd,
+            )
             ex.pack(side="left", padx=(2, 8))
             ttk.Label(row, text="Y").pack(side="left")
-            ey = ttk.Entry(row, textvariable=self.bulk_single_vars[f"offset_{idx}_y"], width=8)
+            ey = ttk.Entry(
+                row,
+                textvariable=self.bulk_single_vars[f"offset_{idx}_y"],
+                width=8,
+                validate="key",
+                validatecommand=offset_vcmd,
+            )
             ey.pack(side="left", padx=(2, 0))
             self.bulk_single_inputs[f"offset_{idx}_x"] = ex
             self.bulk_single_inputs[f"offset_{idx}_y"] = ey
@@ -878,70 +1829,25 @@ class SpritePipelineApp(BaseTk):
         edit_frame.grid(row=2, column=0, sticky="nsew", pady=(8, 0))
         edit_frame.columnconfigure(2, weight=1)
         self.bulk_edit_frame = edit_frame
+        # The form itself (~45 widgets) is built on first switch to bulk mode.
+        self._bulk_edit_form_built = False
+        self._bulk_set_single_editor_enabled(False)
+        self._bulk_update_mode_visibility()
 
-        bulk_fields = [
-            ("id", "ID"),
-            ("name", "Name"),
-            ("set_id", "Set ID"),
-            ("category", "Category"),
-            ("theme", "Theme"),
-            ("tiles_x", "Tiles X"),
-            ("tiles_y", "Tiles Y"),
-            ("variant_group", "Variant Group"),
-            ("variant_label", "Variant Label"),
-            ("group_label", "Group Label"),
-            ("manufacturer", "Manufacturer"),
-            ("link", "Link"),
-            ("instructions", "Instructions"),
-            ("notes", "Notes"),
-        ]
-
-        for row_idx, (key, label) in enumerate(bulk_fields):
-            self.bulk_apply_vars[key] = tk.BooleanVar(value=False)
-            self.bulk_field_vars[key] = tk.StringVar(value="")
-            cb = ttk.Checkbutton(edit_frame, variable=self.bulk_apply_vars[key])
-            cb.grid(row=row_idx, column=0, sticky="w", padx=(0, 4))
-            ttk.Label(edit_frame, text=label).grid(row=row_idx, column=1, sticky="w", pady=2)
-            if key in ("category", "theme"):
-                self.bulk_multi_mode_vars[key] = tk.StringVar(value="Append")
-                choices = CATEGORY_OPTIONS if key == "category" else THEME_OPTIONS
-                row = ttk.Frame(edit_frame)
-                row.grid(row=row_idx, column=2, sticky="ew", pady=2)
-                row.columnconfigure(0, weight=1)
-                w = ttk.Combobox(row, values=choices, textvariable=self.bulk_field_vars[key], state="normal")
-                w.grid(row=0, column=0, sticky="ew")
-                ttk.Button(
-                    row,
-                    text="+",
-                    width=3,
-                    command=lambda field=key: self._append_multi_value_bulk(field, field),
-                ).grid(row=0, column=1, padx=(4, 0))
-                ttk.Combobox(
-                    row,
-                    values=("Append", "Replace"),
-                    textvariable=self.bulk_multi_mode_vars[key],
-                    state="readonly",
-                    width=9,
-                ).grid(row=0, column=2, padx=(4, 0))
-                help_label = ttk.Label(row, text="?", foreground="#4a6fa5")
-                help_label.grid(row=0, column=3, padx=(4, 0))
-                help_label.configure(cursor="question_arrow")
-                help_label.bind(
-                    "<Enter>",
-                    lambda e, field=key: self._schedule_bulk_multi_mode_hint(e.widget, field),
-                )
-                help_label.bind("<Leave>", lambda _e: self._hide_hover_tooltip())
-                help_label.bind("<ButtonPress-1>", lambda _e: self._hide_hover_tooltip())
-            else:
-                w = ttk.Entry(edit_frame, textvariable=self.bulk_field_vars[key])
-                w.grid(row=row_idx, column=2, sticky="ew", pady=2)
-            if key in ("id", "name"):
-                self.bulk_apply_vars[key].set(False)
-                cb.configure(state="disabled")
-                w.configure(state="disabled")
+    def _bulk_build_edit_form(self) -> None:
+        if self._bulk_edit_form_built:
+            return
+        self._bulk_edit_form_built = True
+        edit_frame = self.bulk_edit_frame
+        factories = {
+            "category": self._make_bulk_multi_input,
+            "theme": self._make_bulk_multi_input,
+        }
+        for row_idx, (key, label) in enumerate(BULK_EDIT_FIELDS):
+            self._make_bulk_edit_row(edit_frame, row_idx, key, label, factories.get(key, self._make_bulk_entry_input))
 
         action_row = ttk.Frame(edit_frame)
-        action_row.grid(row=len(bulk_fields), column=0, columnspan=3, sticky="ew", pady=(10, 0))
+        action_row.grid(row=len(BULK_EDIT_FIELDS), column=0, columnspan=3, sticky="ew", pady=(10, 0))
         ttk.Button(action_row, text="Apply To Selected", command=self._bulk_apply_to_selected).pack(side="left")
         ttk.Button(
             action_row,
@@ -950,10 +1856,56 @@ class SpritePipelineApp(BaseTk):
         ).pack(side="left", padx=(6, 0))
         ttk.Button(action_row, text="Clear Fields", command=self._bulk_clear_fields).pack(side="left", padx=(6, 0))
         ttk.Label(edit_frame, textvariable=self.bulk_apply_status_var, foreground="#707070").grid(
-            row=len(bulk_fields) + 1, column=0, columnspan=3, sticky="w", pady=(8, 0)
+            row=len(BULK_EDIT_FIELDS) + 1, column=0, columnspan=3, sticky="w", pady=(8, 0)
         )
-        self._bulk_set_single_editor_enabled(False)
-        self._bulk_update_mode_visibility()
+
+    def _make_bulk_edit_row(self, frame: ttk.Frame, row_idx: int, key: str, label: str, factory) -> None:
+        self.bulk_apply_vars[key] = tk.BooleanVar(value=False)
+        self.bulk_field_vars[key] = tk.StringVar(value="")
+        cb = ttk.Checkbutton(frame, variable=self.bulk_apply_vars[key])
+        cb.grid(row=row_idx, column=0, sticky="w", padx=(0, 4))
+        ttk.Label(frame, text=label).grid(row=row_idx, column=1, sticky="w", pady=2)
+        w = factory(frame, row_idx, key)
+        if key in ("id", "name"):
+            cb.configure(state="disabled")
+            w.configure(state="disabled")
+
+    def _make_bulk_entry_input(self, frame: ttk.Frame, row_idx: int, key: str) -> tk.Widget:
+        w = ttk.Entry(frame, textvariable=self.bulk_field_vars[key])
+        w.grid(row=row_idx, column=2, sticky="ew", pady=2)
+        return w
+
+    def _make_bulk_multi_input(self, frame: ttk.Frame, row_idx: int, key: str) -> tk.Widget:
+        self.bulk_multi_mode_vars[key] = tk.StringVar(value="Append")
+        choices = CATEGORY_OPTIONS if key == "category" else THEME_OPTIONS
+        row = ttk.Frame(frame)
+        row.grid(row=row_idx, column=2, sticky="ew", pady=2)
+        row.columnconfigure(0, weight=1)
+        w = ttk.Combobox(row, values=choices, textvariable=self.bulk_field_vars[key], state="normal")
+        w.grid(row=0, column=0, sticky="ew")
+        ttk.Button(
+            row,
+            text="+",
+            width=3,
+            command=lambda field=key: self._append_multi_value_bulk(field, field),
+        ).grid(row=0, column=1, padx=(4, 0))
+        ttk.Combobox(
+            row,
+            values=("Append", "Replace"),
+            textvariable=self.bulk_multi_mode_vars[key],
+            state="readonly",
+            width=9,
+        ).grid(row=0, column=2, padx=(4, 0))
+        help_label = ttk.Label(row, text="?", foreground="#4a6fa5")
+        help_label.grid(row=0, column=3, padx=(4, 0))
+        help_label.configure(cursor="question_arrow")
+        help_label.bind(
+            "<Enter>",
+            lambda e, field=key: self._schedule_bulk_multi_mode_hint(e.widget, field),
+        )
+        help_label.bind("<Leave>", lambda _e: self._hide_hover_tooltip())
+        help_label.bind("<ButtonPress-1>", lambda _e: self._hide_hover_tooltip())
+        return w
 
     def _schedule_bulk_multi_mode_hint(self, widget: tk.Widget, field: str) -> None:
         self._hide_hover_tooltip()
@@ -1047,7 +1999,11 @@ class SpritePipelineApp(BaseTk):
         self._sync_zip_name_to_id(force=True)
 
     def _reset_sprite_editor(self) -> None:
+        for item in self.items:
+            item.scaled_previews().clear()
         self.items.clear()
+        self._item_paths.clear()
+        self._auto_guides_cache.clear()
         self.active_idx = None
         self.pack_meta = PackMetadata()
         self.preview_zoom = 0.55
@@ -1057,6 +2013,8 @@ class SpritePipelineApp(BaseTk):
         self.export_format_var.set("webp")
         self.webp_quality_var.set("95")
         self.webp_lossless_var.set(False)
+        self.webp_max_compression_var.set(False)
+        self.png_compress_level_var.set("1")
         self.append_metadata_name_var.set(True)
 
         self.meta_vars["id"].set(self.pack_meta.id)
@@ -1143,6 +2101,7 @@ class SpritePipelineApp(BaseTk):
     def _bulk_update_mode_visibility(self) -> None:
         mode = self.bulk_mode_var.get().strip().lower()
         if mode == "bulk":
+            self._bulk_build_edit_form()
             self.bulk_single_frame.grid_remove()
             self.bulk_edit_frame.grid()
         else:
@@ -1157,6 +2116,9 @@ class SpritePipelineApp(BaseTk):
             self.bulk_tree.heading(col, text=text, command=lambda c=col: self._bulk_sort_by_column(c))
 
     def _bulk_sort_by_column(self, column: str) -> None:
+        if self._bulk_loading:
+            self.bell()
+            return
         if not self.bulk_entries:
             self.bulk_sort_column = column
             self.bulk_sort_reverse = False
@@ -1167,31 +2129,46 @@ class SpritePipelineApp(BaseTk):
         else:
             self.bulk_sort_column = column
             self.bulk_sort_reverse = False
+        self._bulk_scan_order_pending = False
+
+        keys = self._bulk_sort_keys.get(column)
+        if keys is None or len(keys) != len(self.bulk_entries):
+            keys = [str(e.get(column, "")).strip().lower() for e in self.bulk_entries]
+            self._bulk_sort_keys[column] = keys
+        # Sort indices on the precomputed keys (stable, like the old key= sort)
+        # and carry every cached key column along so re-sorts skip normalizing.
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=self.bulk_sort_reverse)
+        self._bulk_sort_keys = {
+            col: [cached[i] for i in order]
+            for col, cached in self._bulk_sort_keys.items()
+            if len(cached) == len(order)
+        }
+        self._bulk_set_entries_keep_selection([self.bulk_entries[i] for i in order])
+        self._bulk_update_tree_heading_labels()
 
-        selected_entries: list[dict] = []
+    def _bulk_set_entries_keep_selection(self, entries: list[dict]) -> None:
+        selected_ids: set[int] = set()
         for iid in self.bulk_tree.selection():
             entry = self.bulk_entry_by_iid.get(iid)
             if entry is not None:
-                selected_entries.append(entry)
-
-        self.bulk_entries.sort(
-            key=lambda e: str(e.get(column, "")).strip().lower(),
-            reverse=self.bulk_sort_reverse,
-        )
-        self._refresh_bulk_tree()
-        self._bulk_update_tree_heading_labels()
+                selected_ids.add(id(entry))
+        self.bulk_entries[:] = entries
+        self._refresh_bulk_tree(update_editor=False)
 
         reselect_iids: list[str] = []
         for idx, entry in enumerate(self.bulk_entries):
-            if entry in selected_entries:
+            if id(entry) in selected_ids:
                 reselect_iids.append(str(idx))
         if reselect_iids:
+            self._bulk_ensure_tree_rows(int(reselect_iids[-1]) + 1)
             self.bulk_tree.selection_set(tuple(reselect_iids))
             self.bulk_tree.focus(reselect_iids[0])
             self.bulk_tree.see(reselect_iids[0])
-            self._bulk_on_tree_select()
+        # The editor still shows the same entry; the <<TreeviewSelect>> events
+        # queued by the rebuild find it loaded and leave it alone.
 
     def _bulk_clear_single_editor_fields(self) -> None:
+        self._bulk_editor_entry = None
         for var in self.bulk_single_vars.values():
             var.set("")
         self._multi_value_memory["bulk_single:category"] = []
@@ -1204,6 +2181,12 @@ class SpritePipelineApp(BaseTk):
         return self.bulk_entry_by_iid.get(selected[0], None)
 
     def _bulk_on_tree_select(self, _event=None) -> None:
+        # The editor is cleared and the status updated right away; reading the
+        # metadata (possibly inflating a zip) waits until keyboard navigation
+        # settles. Direct calls (reload, reselect after save) load immediately.
+        if self._bulk_select_after_id is not None:
+            self.bulk_tree.after_cancel(self._bulk_select_after_id)
+            self._bulk_select_after_id = None
         selected = self.bulk_tree.selection()
         if len(selected) == 0:
             self._bulk_clear_single_editor_fields()
@@ -1221,6 +2204,23 @@ class SpritePipelineApp(BaseTk):
             self._bulk_set_single_editor_enabled(False)
             self.bulk_single_status_var.set("Unable to resolve selected row.")
             return
+        if _event is not None and entry is self._bulk_editor_entry:
+            # Re-selection of the row already in the editor (tree rebuilt by a
+            # sort): keep its fields, including unsaved edits.
+            return
+        self._bulk_clear_single_editor_fields()
+        self._bulk_set_single_editor_enabled(False)
+        self.bulk_single_status_var.set(f"Loading: {entry.get('location', '')}")
+        if _event is None:
+            self._bulk_on_tree_select_impl()
+        else:
+            self._bulk_select_after_id = self.bulk_tree.after(120, self._bulk_on_tree_select_impl)
+
+    def _bulk_on_tree_select_impl(self) -> None:
+        self._bulk_select_after_id = None
+        entry = self._bulk_selected_entry()
+        if entry is None:
+            return
         meta = self._bulk_read_entry_metadata(entry)
         if meta is None:
             self._bulk_clear_single_editor_fields()
@@ -1231,12 +2231,11 @@ class SpritePipelineApp(BaseTk):
             if key in ("tiles_x", "tiles_y"):
                 var.set(str(meta.get(key, "")))
             elif key.startswith("offset_"):
-                m = re.fullmatch(r"offset_(\d+)_(x|y)", key)
-                if m is None:
+                parsed = _OFFSET_KEY_MAP.get(key)
+                if parsed is None:
                     var.set("0")
                     continue
-                idx = m.group(1)
-                axis = 0 if m.group(2) == "x" else 1
+                idx, axis = parsed
                 offsets = meta.get("offsets", {})
                 value = 0.0
                 if isinstance(offsets, dict):
@@ -1250,6 +2249,7 @@ class SpritePipelineApp(BaseTk):
                     self._remember_multi_value("bulk_single", key, key, var.get())
                 else:
                     var.set(str(meta.get(key, "")).strip())
+        self._bulk_editor_entry = entry
         self._bulk_set_single_editor_enabled(True)
         self.bulk_single_status_var.set(f"Editing: {entry.get('location', '')}")
 
@@ -1267,18 +2267,76 @@ class SpritePipelineApp(BaseTk):
 
     def _read_json_from_zip_path(self, zip_path: Path, zip_chain: list[str], zip_entry_path: str) -> Optional[dict]:
         try:
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                payload = self._read_bytes_from_zip_chain(zf, zip_chain, zip_entry_path)
-            return self._parse_json_bytes(payload)
+            return self._parse_json_bytes(self._read_bytes_from_zip_path(zip_path, zip_chain, zip_entry_path))
         except Exception:
             return None
 
-    def _read_bytes_from_zip_chain(self, zip_file: zipfile.ZipFile, zip_chain: list[str], leaf_path: str) -> bytes:
-        if not zip_chain:
-            return zip_file.read(leaf_path)
-        nested_payload = zip_file.read(zip_chain[0])
-        with zipfile.ZipFile(BytesIO(nested_payload), "r") as nested_zip:
-            return self._read_bytes_from_zip_chain(nested_zip, zip_chain[1:], leaf_path)
+    def _read_bytes_from_zip_path(self, zip_path: Path, zip_chain: list[str], zip_entry_path: str) -> bytes:
+        with self._zip_cache_lock:
+            if not zip_chain:
+                return self._cached_zip_handle(zip_path).read(zip_entry_path)
+            nested_payload = self._cached_nested_zip_bytes(zip_path, zip_chain)
+            with zipfile.ZipFile(BytesIO(nested_payload), "r") as nested_zip:
+                return nested_zip.read(zip_entry_path)
+
+    def _cached_zip_handle(self, zip_path: Path) -> zipfile.ZipFile:
+        # Caller holds _zip_cache_lock.
+        st = zip_path.stat()
+        key = str(zip_path)
+        cached = self._zip_handle_cache.pop(key, None)
+        if cached is not None:
+            if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._zip_handle_cache[key] = cached
+                return cached[2]
+            cached[2].close()
+        zf = zipfile.ZipFile(zip_path, "r")
+        self._zip_handle_cache[key] = (st.st_mtime_ns, st.st_size, zf)
+        while len(self._zip_handle_cache) > 8:
+            oldest = next(iter(self._zip_handle_cache))
+            self._zip_handle_cache.pop(oldest)[2].close()
+        return zf
+
+    def _cached_nested_zip_bytes(self, zip_path: Path, zip_chain: list[str]) -> bytes:
+        # Caller holds _zip_cache_lock. Returns the bytes of the innermost
+        # archive in zip_chain, caching every level on the way down.
+        outer = self._cached_zip_handle(zip_path)
+        mtime_ns, size, _zf = self._zip_handle_cache[str(zip_path)]
+        payload = b""
+        for depth in range(1, len(zip_chain) + 1):
+            key = (str(zip_path), tuple(zip_chain[:depth]))
+            cached = self._nested_zip_cache.get(key)
+            if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+                payload = cached[2]
+                continue
+            if depth == 1:
+                payload = outer.read(zip_chain[0])
+            else:
+                with zipfile.ZipFile(BytesIO(payload), "r") as parent_zip:
+                    payload = parent_zip.read(zip_chain[depth - 1])
+            self._store_nested_zip_bytes(key, mtime_ns, size, payload)
+        return payload
+
+    def _store_nested_zip_bytes(
+        self, key: tuple[str, tuple[str, ...]], mtime_ns: int, size: int, payload: bytes
+    ) -> None:
+        # Caller holds _zip_cache_lock. Very large nested archives are not
+        # worth pinning in memory.
+        if len(payload) > 64 * 1024 * 1024:
+            return
+        self._nested_zip_cache.pop(key, None)
+        self._nested_zip_cache[key] = (mtime_ns, size, payload)
+        while len(self._nested_zip_cache) > 16:
+            self._nested_zip_cache.pop(next(iter(self._nested_zip_cache)))
+
+    def _evict_zip_cache(self, zip_path: Optional[Path] = None) -> None:
+        # Close cached handles before an archive is rewritten: Windows will
+        # not os.replace() a file that is still open.
+        with self._zip_cache_lock:
+            key = None if zip_path is None else str(zip_path)
+            for path_key in [k for k in self._zip_handle_cache if key is None or k == key]:
+                self._zip_handle_cache.pop(path_key)[2].close()
+            for nested_key in [k for k in self._nested_zip_cache if key is None or k[0] == key]:
+                self._nested_zip_cache.pop(nested_key)
 
     def _bulk_build_single_updates(self, current_meta: dict) -> dict:
         updates: dict[str, object] = {}
@@ -1320,24 +2378,12 @@ class SpritePipelineApp(BaseTk):
             raw_x = self.bulk_single_vars[f"offset_{idx}_x"].get()
             raw_y = self.bulk_single_vars[f"offset_{idx}_y"].get()
             offsets[str(idx)] = [
-                _safe_float(raw_x, default_x),
-                _safe_float(raw_y, default_y),
+                _parse_offset(raw_x, default_x),
+                _parse_offset(raw_y, default_y),
             ]
         updates["offsets"] = offsets
         return updates
 
-    def _bulk_reselect_entry(self, entry: dict) -> None:
-        try:
-            idx = self.bulk_entries.index(entry)
-        except ValueError:
-            self._bulk_on_tree_select()
-            return
-        iid = str(idx)
-        self.bulk_tree.selection_set(iid)
-        self.bulk_tree.focus(iid)
-        self.bulk_tree.see(iid)
-        self._bulk_on_tree_select()
-
     def _bulk_save_selected_single(self) -> None:
         entry = self._bulk_selected_entry()
         if entry is None:
@@ -1352,8 +2398,7 @@ class SpritePipelineApp(BaseTk):
             source = entry.get("source", "")
             if source == "folder":
                 path = Path(str(entry.get("metadata_path", "")))
-                with path.open("w", encoding="utf-8") as f:
-                    json.dump(new_data, f, indent=2, ensure_ascii=True)
+                _write_json_atomic(path, new_data)
             elif source == "zip":
                 zip_path = Path(str(entry.get("zip_path", "")))
                 zip_chain = list(entry.get("zip_chain", []))
@@ -1363,8 +2408,8 @@ class SpritePipelineApp(BaseTk):
                 messagebox.showerror("Single metadata edit", f"Unknown source type: {source}")
                 return
             self._bulk_update_entry_summary(entry, new_data)
-            self._refresh_bulk_tree()
-            self._bulk_reselect_entry(entry)
+            self._bulk_update_tree_row(entry)
+            self._bulk_on_tree_select()
             self.bulk_single_status_var.set(f"Saved: {entry.get('location', '')}")
         except Exception as exc:
             messagebox.showerror("Single metadata edit", f"Failed to save selected metadata:\n{exc}")
@@ -1393,53 +2438,266 @@ class SpritePipelineApp(BaseTk):
         if not root_path.exists() or not root_path.is_dir():
             messagebox.showerror("Bulk metadata scan", f"Folder does not exist:\n{root_path}")
             return
-        entries = self._collect_bulk_metadata_entries(root_path)
-        self.bulk_entries = entries
+        # Scan on a worker thread so large trees do not freeze the UI. Entries
+        # stream back over a queue and _bulk_drain_scan_queue adds them to the
+        # tree in batches while the walk is still running.
+        self._bulk_scan_generation += 1
+        generation = self._bulk_scan_generation
+        scan_queue: queue.Queue = queue.Queue()
+        self.bulk_entries = []
+        self._bulk_sort_keys.clear()
         self._refresh_bulk_tree()
-        self.bulk_status_var.set(f"Found {len(entries)} metadata.json file(s).")
         self.bulk_apply_status_var.set("")
+        self._bulk_scan_order_pending = True
+        self._bulk_loading = True
+        self.bulk_status_var.set(f"Scanning {root_path} ...")
+        threading.Thread(target=self._bulk_scan_worker, args=(generation, root_path, scan_queue), daemon=True).start()
+        self.after(50, lambda: self._bulk_drain_scan_queue(generation, scan_queue))
+
+    def _bulk_scan_worker(self, generation: int, root_path: Path, scan_queue: queue.Queue) -> None:
+        error = ""
+        try:
+            for entry in self._iter_bulk_metadata_entries(root_path):
+                if generation != self._bulk_scan_generation:
+                    # Superseded by a newer scan; nobody drains this queue.
+                    return
+                scan_queue.put(("entry", entry))
+        except Exception as exc:
+            error = str(exc)
+        scan_queue.put(("done", error))
 
-    def _collect_bulk_metadata_entries(self, root_path: Path) -> list[dict]:
-        entries: list[dict] = []
-        for dirpath, _dirnames, filenames in os.walk(root_path):
-            base = Path(dirpath)
-            if "metadata.json" in filenames:
-                metadata_path = base / "metadata.json"
-                data = self._load_json_file(metadata_path)
-                if data is not None:
-                    entries.append(
-                        {
-                            "source": "folder",
-                            "metadata_path": str(metadata_path),
-                            "zip_path": "",
-                            "zip_entry_path": "",
-                            "id": str(data.get("id", "")).strip(),
-                            "name": str(data.get("name", "")).strip(),
-                            "category": _metadata_multi_to_text(data.get("category", ""), kind="category"),
-                            "theme": _metadata_multi_to_text(data.get("theme", ""), kind="theme"),
-                            "variant_options": self._extract_variant_options_text(data),
-                            "manufacturer": str(data.get("manufacturer", "")).strip(),
-                            "location": str(metadata_path.parent.relative_to(root_path)),
-                        }
-                    )
-            for filename in filenames:
-                if not filename.lower().endswith(".zip"):
-                    continue
-                zip_path = base / filename
-                entries.extend(self._collect_zip_metadata_entries(zip_path, root_path))
-        entries.sort(key=lambda e: (e["id"].lower(), e["name"].lower(), e["location"].lower()))
-        return entries
+    def _bulk_drain_scan_queue(self, generation: int, scan_queue: queue.Queue) -> None:
+        if generation != self._bulk_scan_generation:
+            # A newer scan was started and has its own drain.
+            return
+        batch: list[dict] = []
+        error: Optional[str] = None
+        try:
+            while len(batch) < 200:
+                kind, value = scan_queue.get_nowait()
+                if kind == "done":
+                    error = value
+                    break
+                batch.append(value)
+        except queue.Empty:
+            pass
+        if batch:
+            self._bulk_append_entries(batch)
+            self.bulk_status_var.set(f"Scanned {len(self.bulk_entries)} ...")
+        if error is None:
+            # A full batch means more is likely waiting; come back right away.
+            delay = 1 if len(batch) >= 200 else 50
+            self.after(delay, lambda: self._bulk_drain_scan_queue(generation, scan_queue))
+            return
+        if error:
+            self._bulk_loading = False
+            self.bulk_status_var.set("Scan failed.")
+            messagebox.showerror("Bulk metadata scan", f"Failed to scan folder:\n{error}")
+            return
+        if self._bulk_scan_order_applies():
+            self.bulk_entries.sort(key=_bulk_scan_sort_key)
+            self._bulk_sort_keys.clear()
+            self._refresh_bulk_tree(update_editor=False)
+        entries = self.bulk_entries
+        self._bulk_summary_queue = [entry for entry in entries if not entry.get("summary_loaded", True)]
+        self._bulk_summary_queue_pos = 0
+        self._bulk_summary_submitted = set()
+        self._bulk_summary_inflight = 0
+        with self._bulk_scan_lock:
+            self._bulk_summary_results = []
+        if not self._bulk_summary_queue:
+            self._bulk_scan_order_pending = False
+            self._bulk_loading = False
+            self.bulk_status_var.set(f"Found {len(entries)} metadata.json file(s).")
+            return
+        self.bulk_status_var.set(f"Found {len(entries)} metadata.json file(s), reading details ...")
+        self._bulk_poll_summaries(generation)
+
+    def _bulk_load_summary_worker(self, generation: int, entry: dict) -> None:
+        data = self._load_json_file(Path(str(entry.get("metadata_path", ""))))
+        with self._bulk_scan_lock:
+            self._bulk_summary_results.append((generation, entry, data))
+
+    def _bulk_submit_summary_loads(self, generation: int) -> None:
+        budget = 64 - self._bulk_summary_inflight
+        if budget <= 0:
+            return
+        if self._bulk_summary_pool is None:
+            self._bulk_summary_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        # Rows in view go first, then whatever is left in scan order.
+        first = int(self.bulk_tree.yview()[0] * self._bulk_tree_filled)
+        visible = self.bulk_entries[first:first + 60]
+        queue = self._bulk_summary_queue
+        submitted = self._bulk_summary_submitted
+        for entry in visible + queue[self._bulk_summary_queue_pos:self._bulk_summary_queue_pos + budget]:
+            if budget <= 0:
+                break
+            if entry.get("summary_loaded", True) or id(entry) in submitted:
+                continue
+            submitted.add(id(entry))
+            self._bulk_summary_inflight += 1
+            budget -= 1
+            self._bulk_summary_pool.submit(self._bulk_load_summary_worker, generation, entry)
+        while self._bulk_summary_queue_pos < len(queue) and id(queue[self._bulk_summary_queue_pos]) in submitted:
+            self._bulk_summary_queue_pos += 1
+
+    def _bulk_poll_summaries(self, generation: int) -> None:
+        if generation != self._bulk_scan_generation:
+            return
+        with self._bulk_scan_lock:
+            results = self._bulk_summary_results
+            self._bulk_summary_results = []
+        for result_generation, entry, data in results:
+            if result_generation != generation:
+                continue
+            self._bulk_summary_inflight -= 1
+            if entry.get("summary_loaded", True):
+                # Written by an edit while the read was in flight.
+                continue
+            if data is None:
+                entry["summary_loaded"] = True
+                entry["summary_failed"] = True
+                entry["name"] = "(unreadable metadata.json)"
+            else:
+                self._bulk_update_entry_summary(entry, data)
+            self._bulk_update_tree_row(entry)
+        self._bulk_submit_summary_loads(generation)
+        if self._bulk_summary_inflight > 0 or self._bulk_summary_queue_pos < len(self._bulk_summary_queue):
+            self.after(16, lambda: self._bulk_poll_summaries(generation))
+            return
+        self._bulk_finish_summary_loads()
+
+    def _bulk_scan_order_applies(self) -> bool:
+        # Rows only move into scan order while the user has not sorted,
+        # selected or scrolled; otherwise they stay where they were shown.
+        return (
+            self._bulk_scan_order_pending
+            and not self.bulk_tree.selection()
+            and self.bulk_tree.yview()[0] == 0.0
+        )
 
-    def _collect_zip_metadata_entries(self, zip_path: Path, root_path: Path) -> list[dict]:
+    def _bulk_append_entries(self, entries: list[dict]) -> None:
+        start = len(self.bulk_entries)
+        rows = [
+            (str(idx), tuple(entry.get(col, "") for col in BULK_TREE_COLUMNS))
+            for idx, entry in enumerate(entries, start)
+        ]
+        self.bulk_entries.extend(entries)
+        self.bulk_entry_by_iid.update(zip((iid for iid, _values in rows), entries))
+        self.bulk_idx_by_entry_id.update((id(entry), idx) for idx, entry in enumerate(entries, start))
+        self._bulk_tree_rows.extend(rows)
+        # If a background fill is still catching up it picks these up as well.
+        if self._bulk_tree_filled >= start:
+            self._bulk_ensure_tree_rows(len(self._bulk_tree_rows))
+
+    def _bulk_finish_summary_loads(self) -> None:
+        # With every summary known, rows move into the order an eager scan
+        # would have given them, but only if the user has not selected or
+        # scrolled meanwhile (header sorting is held off until now). The single-row editor is never
+        # reloaded from here. Unreadable files stay listed under their marker.
+        if self._bulk_scan_order_applies():
+            entries = sorted(self.bulk_entries, key=_bulk_scan_sort_key)
+            if [id(entry) for entry in entries] != [id(entry) for entry in self.bulk_entries]:
+                self.bulk_entries[:] = entries
+                self._bulk_sort_keys.clear()
+                self._refresh_bulk_tree(update_editor=False)
+        self._bulk_scan_order_pending = False
+        self._bulk_loading = False
+        self._bulk_summary_queue = []
+        self._bulk_summary_queue_pos = 0
+        self._bulk_summary_submitted = set()
+        failed = sum(1 for entry in self.bulk_entries if entry.get("summary_failed"))
+        status = f"Found {len(self.bulk_entries)} metadata.json file(s)"
+        self.bulk_status_var.set(f"{status}, {failed} unreadable." if failed else f"{status}.")
+
+    def _folder_metadata_entry(self, metadata_path: Path, location: str) -> dict:
+        # Summary fields are filled in later by _bulk_poll_summaries.
+        return {
+            "source": "folder",
+            "metadata_path": str(metadata_path),
+            "zip_path": "",
+            "zip_entry_path": "",
+            "id": "",
+            "name": "",
+            "category": "",
+            "theme": "",
+            "variant_options": "",
+            "manufacturer": "",
+            "location": location,
+            "summary_loaded": False,
+        }
+
+    def _iter_bulk_scan_files(self, base: Path, rel: str = "."):
+        # os.scandir hands back cached type info, so no extra stat per entry.
+        # Like os.walk, symlinked directories are not descended into. The
+        # root-relative path is carried down as a string so the scan never
+        # has to call Path.relative_to per file.
+        # Only subdirectories and matching names are kept, and the name test
+        # runs before is_file() so the only stat calls left are for symlinks
+        # whose names already match.
+        subdirs: list[tuple[str, str]] = []
+        matches: list[tuple[str, str, str]] = []
+        try:
+            with os.scandir(base) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    try:
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            subdirs.append((dir_entry.path, name))
+                            continue
+                        if name == "metadata.json":
+                            kind = "folder"
+                        elif name.lower().endswith(".zip"):
+                            kind = "zip"
+                        else:
+                            continue
+                        if dir_entry.is_file():
+                            matches.append((kind, dir_entry.path, name))
+                    except OSError:
+                        continue
+        except OSError:
+            return
+        for kind, path, name in matches:
+            if kind == "folder":
+                yield ("folder", Path(path), rel)
+            else:
+                yield ("zip", Path(path), name if rel == "." else os.path.join(rel, name))
+        for path, name in subdirs:
+            yield from self._iter_bulk_scan_files(Path(path), name if rel == "." else os.path.join(rel, name))
+
+    def _iter_bulk_metadata_entries(self, root_path: Path):
+        # Folder rows are yielded straight from the walk (their metadata is
+        # not read here at all). Zip reads and inflation release the GIL, so a
+        # thread pool overlaps them across the tree and each archive's rows
+        # follow as soon as it is done.
+        pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2))
+        try:
+            zip_results = []
+            for kind, path, rel in self._iter_bulk_scan_files(root_path):
+                if kind == "folder":
+                    yield self._folder_metadata_entry(path, rel)
+                else:
+                    zip_results.append(pool.submit(self._collect_zip_metadata_entries, path, root_path, rel))
+            for future in as_completed(zip_results):
+                yield from future.result()
+        finally:
+            # An abandoned scan does not wait for archives nobody will read.
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _collect_zip_metadata_entries(self, zip_path: Path, root_path: Path, zip_rel: Optional[str] = None) -> list[dict]:
         out: list[dict] = []
         try:
+            if zip_rel is None:
+                zip_rel = str(zip_path.relative_to(root_path))
+            st = zip_path.stat()
             with zipfile.ZipFile(zip_path, "r") as zf:
                 self._collect_zip_metadata_entries_recursive(
                     zip_file=zf,
                     out=out,
                     zip_path=zip_path,
-                    root_path=root_path,
+                    location_prefix=zip_rel,
                     zip_chain=[],
+                    stamp=(st.st_mtime_ns, st.st_size),
                 )
         except Exception:
             pass
@@ -1450,15 +2708,26 @@ class SpritePipelineApp(BaseTk):
         zip_file: zipfile.ZipFile,
         out: list[dict],
         zip_path: Path,
-        root_path: Path,
+        location_prefix: str,
         zip_chain: list[str],
+        stamp: tuple[int, int],
     ) -> None:
-        for member in zip_file.namelist():
-            member_norm = member.replace("\\", "/")
-            lower_name = member_norm.lower()
-            if lower_name.endswith("/") or member_norm == "":
+        zip_path_text = str(zip_path)
+        for info in zip_file.infolist():
+            # Most members are images; one suffix test on the raw name skips
+            # them (and directory entries) before any normalization happens.
+            member = info.filename
+            lower_name = member.lower()
+            if lower_name.endswith("metadata.json"):
+                is_metadata = True
+            elif lower_name.endswith(".zip"):
+                is_metadata = False
+            else:
                 continue
-            if lower_name == "metadata.json" or lower_name.endswith("/metadata.json"):
+            member_norm = member.replace("\\", "/") if "\\" in member else member
+            if is_metadata:
+                if not (len(member_norm) == 13 or member_norm[-14] == "/"):
+                    continue
                 try:
                     payload = zip_file.read(member)
                     parsed = self._parse_json_bytes(payload)
@@ -1466,12 +2735,11 @@ class SpritePipelineApp(BaseTk):
                         continue
                 except Exception:
                     continue
-                location_parts = [str(zip_path.relative_to(root_path))] + zip_chain + [member_norm]
                 out.append(
                     {
                         "source": "zip",
                         "metadata_path": "",
-                        "zip_path": str(zip_path),
+                        "zip_path": zip_path_text,
                         "zip_chain": list(zip_chain),
                         "zip_entry_path": member_norm,
                         "id": str(parsed.get("id", "")).strip(),
@@ -1480,28 +2748,38 @@ class SpritePipelineApp(BaseTk):
                         "theme": _metadata_multi_to_text(parsed.get("theme", ""), kind="theme"),
                         "variant_options": self._extract_variant_options_text(parsed),
                         "manufacturer": str(parsed.get("manufacturer", "")).strip(),
-                        "location": "::".join(location_parts),
+                        "location": f"{location_prefix}::{member_norm}",
                     }
                 )
                 continue
-            if not lower_name.endswith(".zip"):
-                continue
             try:
-                nested_payload = zip_file.read(member)
+                # Nested archives are inflated once and shared with later
+                # rescans and single-row reads through the nested zip cache.
+                chain_key = (zip_path_text, tuple(zip_chain) + (member_norm,))
+                nested_payload: Optional[bytes] = None
+                with self._zip_cache_lock:
+                    cached = self._nested_zip_cache.get(chain_key)
+                    if cached is not None and (cached[0], cached[1]) == stamp:
+                        nested_payload = cached[2]
+                if nested_payload is None:
+                    nested_payload = zip_file.read(member)
+                    with self._zip_cache_lock:
+                        self._store_nested_zip_bytes(chain_key, stamp[0], stamp[1], nested_payload)
                 with zipfile.ZipFile(BytesIO(nested_payload), "r") as nested_zip:
                     self._collect_zip_metadata_entries_recursive(
                         zip_file=nested_zip,
                         out=out,
                         zip_path=zip_path,
-                        root_path=root_path,
+                        location_prefix=f"{location_prefix}::{member_norm}",
                         zip_chain=zip_chain + [member_norm],
+                        stamp=stamp,
                     )
             except Exception:
                 continue
 
     def _parse_json_bytes(self, payload: bytes) -> Optional[dict]:
         try:
-            parsed = json.loads(payload.decode("utf-8"))
+            parsed = _json_loads(payload)
             if isinstance(parsed, dict):
                 return parsed
         except Exception:
@@ -1509,11 +2787,18 @@ class SpritePipelineApp(BaseTk):
         return None
 
     def _load_json_file(self, path: Path) -> Optional[dict]:
+        # Rescans and edits keep re-reading the same files; reuse the parsed
+        # dict while the file's mtime/size are unchanged.
         try:
-            with path.open("r", encoding="utf-8") as f:
-                parsed = json.load(f)
+            st = path.stat()
+            key = str(path)
+            cached = self._metadata_cache.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return dict(cached[2])
+            parsed = _json_loads(path.read_bytes())
             if isinstance(parsed, dict):
-                return parsed
+                self._metadata_cache[key] = (st.st_mtime_ns, st.st_size, parsed)
+                return dict(parsed)
         except Exception:
             return None
         return None
@@ -1533,36 +2818,67 @@ class SpritePipelineApp(BaseTk):
         return " / ".join(parts)
 
     def _bulk_update_entry_summary(self, entry: dict, data: dict) -> None:
+        self._bulk_sort_keys.clear()
         entry["id"] = str(data.get("id", "")).strip()
         entry["name"] = str(data.get("name", "")).strip()
         entry["category"] = _metadata_multi_to_text(data.get("category", ""), kind="category")
         entry["theme"] = _metadata_multi_to_text(data.get("theme", ""), kind="theme")
         entry["variant_options"] = self._extract_variant_options_text(data)
         entry["manufacturer"] = str(data.get("manufacturer", "")).strip()
+        entry["summary_loaded"] = True
 
-    def _refresh_bulk_tree(self) -> None:
-        for iid in self.bulk_tree.get_children():
-            self.bulk_tree.delete(iid)
+    def _refresh_bulk_tree(self, update_editor: bool = True) -> None:
+        children = self.bulk_tree.get_children()
+        if children:
+            # One Tcl call for the whole list instead of one per row.
+            self.bulk_tree.delete(*children)
         self.bulk_entry_by_iid.clear()
-        for idx, entry in enumerate(self.bulk_entries):
-            iid = str(idx)
-            self.bulk_entry_by_iid[iid] = entry
-            self.bulk_tree.insert(
-                "",
-                "end",
-                iid=iid,
-                values=(
-                    entry.get("id", ""),
-                    entry.get("name", ""),
-                    entry.get("category", ""),
-                    entry.get("theme", ""),
-                    entry.get("variant_options", ""),
-                    entry.get("manufacturer", ""),
-                    entry.get("source", ""),
-                    entry.get("location", ""),
-                ),
-            )
-        self._bulk_on_tree_select()
+        # Build all row tuples up front so the insert loop is only Tk calls.
+        rows = [
+            (str(idx), tuple(entry.get(col, "") for col in BULK_TREE_COLUMNS))
+            for idx, entry in enumerate(self.bulk_entries)
+        ]
+        self.bulk_entry_by_iid.update(zip((iid for iid, _values in rows), self.bulk_entries))
+        self.bulk_idx_by_entry_id = {id(entry): idx for idx, entry in enumerate(self.bulk_entries)}
+        self._bulk_tree_rows = rows
+        self._bulk_tree_filled = 0
+        self._bulk_tree_generation += 1
+        # Only what can be on screen is inserted now; large scans finish
+        # filling in the background so a rebuild never stalls the UI.
+        self._bulk_ensure_tree_rows(200)
+        if self._bulk_tree_filled < len(rows):
+            generation = self._bulk_tree_generation
+            self.after(1, lambda: self._bulk_fill_tree(generation))
+        if update_editor:
+            self._bulk_on_tree_select()
+
+    def _bulk_update_tree_row(self, entry: dict) -> None:
+        # Push one entry's summary into its row without rebuilding the tree.
+        idx = self.bulk_idx_by_entry_id.get(id(entry))
+        if idx is None:
+            return
+        iid = str(idx)
+        values = tuple(entry.get(col, "") for col in BULK_TREE_COLUMNS)
+        self._bulk_tree_rows[idx] = (iid, values)
+        if idx < self._bulk_tree_filled:
+            self.bulk_tree.item(iid, values=values)
+
+    def _bulk_ensure_tree_rows(self, count: int) -> None:
+        # Make sure rows [0, count) exist in the tree (e.g. before selecting one).
+        end = min(count, len(self._bulk_tree_rows))
+        if end <= self._bulk_tree_filled:
+            return
+        insert = self.bulk_tree.insert
+        for iid, values in self._bulk_tree_rows[self._bulk_tree_filled:end]:
+            insert("", "end", iid=iid, values=values)
+        self._bulk_tree_filled = end
+
+    def _bulk_fill_tree(self, generation: int) -> None:
+        if generation != self._bulk_tree_generation:
+            return
+        self._bulk_ensure_tree_rows(self._bulk_tree_filled + 500)
+        if self._bulk_tree_filled < len(self._bulk_tree_rows):
+            self.after(1, lambda: self._bulk_fill_tree(generation))
 
     def _bulk_clear_fields(self) -> None:
         for var in self.bulk_apply_vars.values():
@@ -1631,20 +2947,15 @@ class SpritePipelineApp(BaseTk):
             messagebox.showinfo("Bulk metadata", "Select at least one field checkbox to apply.")
             return
 
-        updated_count = 0
-        errors: list[str] = []
+        pending: list[tuple[dict, dict[str, object]]] = []
         for iid in selected:
             entry = self.bulk_entry_by_iid.get(iid)
-            if entry is None:
-                continue
-            try:
-                self._bulk_apply_single_entry(entry, updates)
-                updated_count += 1
-            except Exception as exc:
-                location = entry.get("location", "unknown")
-                errors.append(f"{location}: {exc}")
+            if entry is not None:
+                pending.append((entry, updates))
+        updated_count, errors = self._bulk_apply_entries(pending)
 
-        self._refresh_bulk_tree()
+        for entry, _updates in pending:
+            self._bulk_update_tree_row(entry)
         self.bulk_apply_status_var.set(f"Updated {updated_count}/{len(selected)} selected metadata file(s).")
         if errors:
             messagebox.showwarning("Bulk metadata warnings", "\n".join(errors[:10]))
@@ -1670,7 +2981,7 @@ class SpritePipelineApp(BaseTk):
         if not selected:
             messagebox.showinfo("Bulk metadata", "Select one or more rows first.")
             return
-        updated_count = 0
+        pending: list[tuple[dict, dict[str, object]]] = []
         errors: list[str] = []
         for iid in selected:
             entry = self.bulk_entry_by_iid.get(iid)
@@ -1683,18 +2994,81 @@ class SpritePipelineApp(BaseTk):
                 new_id = self._bulk_compose_id_from_meta(meta)
                 if not new_id:
                     raise ValueError("Missing set_id, manufacturer, or current id")
-                self._bulk_apply_single_entry(entry, {"id": new_id})
-                updated_count += 1
+                pending.append((entry, {"id": new_id}))
             except Exception as exc:
                 location = entry.get("location", "unknown")
                 errors.append(f"{location}: {exc}")
-        self._refresh_bulk_tree()
+        updated_count, apply_errors = self._bulk_apply_entries(pending)
+        errors.extend(apply_errors)
+        for entry, _updates in pending:
+            self._bulk_update_tree_row(entry)
         self.bulk_apply_status_var.set(
             f"Updated {updated_count}/{len(selected)} selected metadata file(s) with composed IDs."
         )
         if errors:
             messagebox.showwarning("Bulk metadata warnings", "\n".join(errors[:10]))
 
+    def _bulk_apply_entries(self, pending: list[tuple[dict, dict[str, object]]]) -> tuple[int, list[str]]:
+        # Folder entries are written one by one; zip entries are grouped so
+        # each archive is rewritten once no matter how many rows it holds.
+        updated_count = 0
+        errors: list[str] = []
+        zip_groups: dict[str, list[tuple[dict, dict[str, object]]]] = {}
+        for entry, updates in pending:
+            if entry.get("source", "") == "zip":
+                zip_groups.setdefault(str(entry.get("zip_path", "")), []).append((entry, updates))
+                continue
+            try:
+                self._bulk_apply_single_entry(entry, updates)
+                updated_count += 1
+            except Exception as exc:
+                errors.append(f"{entry.get('location', 'unknown')}: {exc}")
+        # Rewritten archives are staged next to their originals and only
+        # swapped in once every archive has been rewritten, so a failed
+        # rewrite leaves all zips untouched and no temp files behind. A failed
+        # swap (e.g. a zip locked by another program) stops the remaining
+        # swaps; archives swapped before it keep their new contents.
+        staged: list[tuple[Path, Path]] = []
+        group_results: list[tuple[str, list[tuple[dict, dict[str, object]]], list[object]]] = []
+        failed_zip = ""
+        for zip_path_text, group in zip_groups.items():
+            edits = [
+                (list(entry.get("zip_chain", [])), str(entry.get("zip_entry_path", "")), updates)
+                for entry, updates in group
+            ]
+            try:
+                results = self._rewrite_zip_metadata(Path(zip_path_text), edits, batch_mode=True, staged=staged)
+            except Exception as exc:
+                results = [exc] * len(group)
+                failed_zip = failed_zip or zip_path_text
+            group_results.append((str(Path(zip_path_text)), group, results))
+        replace_errors: dict[str, Exception] = {}
+        for tmp_path, zip_path in staged:
+            if failed_zip:
+                replace_errors[str(zip_path)] = RuntimeError(f"not written, {Path(failed_zip).name} failed")
+            else:
+                try:
+                    os.replace(tmp_path, zip_path)
+                    continue
+                except Exception as exc:
+                    replace_errors[str(zip_path)] = exc
+                    failed_zip = str(zip_path)
+            try:
+                tmp_path.unlink()
+            except Exception:
+                pass
+        for zip_key, group, results in group_results:
+            replace_error = replace_errors.get(zip_key)
+            for (entry, _updates), result in zip(group, results):
+                if replace_error is not None and isinstance(result, dict):
+                    result = replace_error
+                if isinstance(result, dict):
+                    self._bulk_update_entry_summary(entry, result)
+                    updated_count += 1
+                else:
+                    errors.append(f"{entry.get('location', 'unknown')}: {result}")
+        return updated_count, errors
+
     def _bulk_apply_single_entry(self, entry: dict, updates: dict[str, object]) -> None:
         source = entry.get("source", "")
         if source == "folder":
@@ -1703,16 +3077,18 @@ class SpritePipelineApp(BaseTk):
             if data is None:
                 raise ValueError("Unable to read metadata.json")
             new_data = self._apply_updates_to_metadata(data, updates)
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(new_data, f, indent=2, ensure_ascii=True)
+            if new_data != data:
+                _write_json_atomic(path, new_data)
             self._bulk_update_entry_summary(entry, new_data)
             return
         if source == "zip":
             zip_path = Path(str(entry.get("zip_path", "")))
             zip_chain = list(entry.get("zip_chain", []))
             zip_entry_path = str(entry.get("zip_entry_path", ""))
-            new_data = self._rewrite_zip_metadata(zip_path, zip_chain, zip_entry_path, updates)
-            self._bulk_update_entry_summary(entry, new_data)
+            result = self._rewrite_zip_metadata(zip_path, [(zip_chain, zip_entry_path, updates)])[0]
+            if not isinstance(result, dict):
+                raise result
+            self._bulk_update_entry_summary(entry, result)
             return
         raise ValueError(f"Unknown source type: {source}")
 
@@ -1741,39 +3117,39 @@ class SpritePipelineApp(BaseTk):
         return updated
 
     def _rewrite_zip_metadata(
-        self, zip_path: Path, zip_chain: list[str], zip_entry_path: str, updates: dict[str, object]
-    ) -> dict:
+        self,
+        zip_path: Path,
+        edits: list[tuple[list[str], str, dict[str, object]]],
+        batch_mode: bool = False,
+        staged: Optional[list[tuple[Path, Path]]] = None,
+    ) -> list[object]:
+        # Applies every (zip_chain, zip_entry_path, updates) edit in one pass
+        # over the archive. Returns, per edit, the updated metadata dict or
+        # the exception explaining why that entry could not be updated.
+        # In batch mode the rewritten archive is not swapped in; its
+        # (tmp_path, zip_path) pair is appended to staged for the caller.
+        self._evict_zip_cache(zip_path)
         tmp_fd, tmp_name = tempfile.mkstemp(prefix="sprite-meta-", suffix=".zip", dir=str(zip_path.parent))
         os.close(tmp_fd)
         tmp_path = Path(tmp_name)
-        updated_meta: Optional[dict] = None
+        results: list[object] = [None] * len(edits)
+        indexed = [(idx, list(chain), entry_path, updates) for idx, (chain, entry_path, updates) in enumerate(edits)]
+        keep_tmp = False
         try:
             with zipfile.ZipFile(zip_path, "r") as src_zip:
                 with zipfile.ZipFile(tmp_path, "w") as dst_zip:
-                    for info in src_zip.infolist():
-                        payload = src_zip.read(info.filename)
-                        current_name = info.filename.replace("\\", "/")
-                        if zip_chain:
-                            if current_name == zip_chain[0]:
-                                payload, updated_meta = self._rewrite_nested_zip_payload(
-                                    payload,
-                                    zip_chain[1:],
-                                    zip_entry_path,
-                                    updates,
-                                )
-                        elif current_name == zip_entry_path:
-                            parsed = self._parse_json_bytes(payload)
-                            if parsed is None:
-                                raise ValueError("metadata.json inside zip is not an object")
-                            updated_meta = self._apply_updates_to_metadata(parsed, updates)
-                            payload = json.dumps(updated_meta, indent=2, ensure_ascii=True).encode("utf-8")
-                        dst_zip.writestr(info, payload)
-            if updated_meta is None:
-                raise ValueError("metadata.json entry not found in zip")
-            os.replace(tmp_path, zip_path)
-            return updated_meta
+                    changed = self._rewrite_zip_members(src_zip, dst_zip, indexed, results)
+            if changed and batch_mode and staged is not None:
+                staged.append((tmp_path, zip_path))
+                keep_tmp = True
+            elif changed:
+                os.replace(tmp_path, zip_path)
+            return [
+                result if result is not None else ValueError("metadata.json entry not found in zip")
+                for result in results
+            ]
         finally:
-            if tmp_path.exists():
+            if not keep_tmp and tmp_path.exists():
                 try:
                     tmp_path.unlink()
                 except Exception:
@@ -1782,6 +3158,15 @@ class SpritePipelineApp(BaseTk):
     def _rewrite_zip_metadata_full(
         self, zip_path: Path, zip_chain: list[str], zip_entry_path: str, new_meta: dict
     ) -> None:
+        # Saving an unedited row would rebuild the whole archive (and every
+        # zip along the chain) for identical bytes; compare first.
+        new_payload = _encode_json_bytes(new_meta)
+        try:
+            if self._read_bytes_from_zip_path(zip_path, zip_chain, zip_entry_path) == new_payload:
+                return
+        except Exception:
+            pass
+        self._evict_zip_cache(zip_path)
         tmp_fd, tmp_name = tempfile.mkstemp(prefix="sprite-meta-", suffix=".zip", dir=str(zip_path.parent))
         os.close(tmp_fd)
         tmp_path = Path(tmp_name)
@@ -1790,8 +3175,11 @@ class SpritePipelineApp(BaseTk):
             with zipfile.ZipFile(zip_path, "r") as src_zip:
                 with zipfile.ZipFile(tmp_path, "w") as dst_zip:
                     for info in src_zip.infolist():
-                        payload = src_zip.read(info.filename)
                         current_name = info.filename.replace("\\", "/")
+                        if current_name != (zip_chain[0] if zip_chain else zip_entry_path):
+                            _copy_zip_member(src_zip, dst_zip, info)
+                            continue
+                        payload = src_zip.read(info.filename)
                         if zip_chain:
                             if current_name == zip_chain[0]:
                                 payload, nested_replaced = self._rewrite_nested_zip_payload_full(
@@ -1804,8 +3192,9 @@ class SpritePipelineApp(BaseTk):
                                     replaced = True
                         elif current_name == zip_entry_path:
                             replaced = True
-                            payload = json.dumps(new_meta, indent=2, ensure_ascii=True).encode("utf-8")
-                        dst_zip.writestr(info, payload)
+                            payload = new_payload
+                        target = _rewritten_member_info(info) if zip_chain else _metadata_member_info(info, payload)
+                        dst_zip.writestr(target, payload)
             if not replaced:
                 raise ValueError("metadata.json entry not found in zip")
             os.replace(tmp_path, zip_path)
@@ -1816,39 +3205,64 @@ class SpritePipelineApp(BaseTk):
                 except Exception:
                     pass
 
+    def _rewrite_zip_members(
+        self,
+        src_zip: zipfile.ZipFile,
+        dst_zip: zipfile.ZipFile,
+        edits: list[tuple[int, list[str], str, dict[str, object]]],
+        results: list[object],
+    ) -> bool:
+        changed = False
+        for info in src_zip.infolist():
+            current_name = info.filename.replace("\\", "/")
+            nested_edits = [
+                (idx, chain[1:], entry_path, updates)
+                for idx, chain, entry_path, updates in edits
+                if chain and chain[0] == current_name
+            ]
+            leaf_edit = any(not chain and entry_path == current_name for _idx, chain, entry_path, _updates in edits)
+            if not nested_edits and not leaf_edit:
+                _copy_zip_member(src_zip, dst_zip, info)
+                continue
+            payload = src_zip.read(info.filename)
+            if nested_edits:
+                new_payload = self._rewrite_nested_zip_payload(payload, nested_edits, results)
+                if new_payload is not payload:
+                    payload = new_payload
+                    changed = True
+            for idx, chain, entry_path, updates in edits:
+                if chain or entry_path != current_name:
+                    continue
+                parsed = self._parse_json_bytes(payload)
+                if parsed is None:
+                    results[idx] = ValueError("metadata.json inside zip is not an object")
+                    continue
+                results[idx] = self._apply_updates_to_metadata(parsed, updates)
+                # An update that leaves the bytes as they were must not force
+                # the archive (and every zip above it) to be rebuilt.
+                new_payload = _encode_json_bytes(results[idx])
+                if new_payload != payload:
+                    payload = new_payload
+                    changed = True
+            target = _metadata_member_info(info, payload) if leaf_edit else _rewritten_member_info(info)
+            dst_zip.writestr(target, payload)
+        return changed
+
     def _rewrite_nested_zip_payload(
         self,
         zip_payload: bytes,
-        zip_chain: list[str],
-        zip_entry_path: str,
-        updates: dict[str, object],
-    ) -> tuple[bytes, Optional[dict]]:
-        updated_meta: Optional[dict] = None
+        edits: list[tuple[int, list[str], str, dict[str, object]]],
+        results: list[object],
+    ) -> bytes:
         src_buffer = BytesIO(zip_payload)
-        out_buffer = BytesIO()
         with zipfile.ZipFile(src_buffer, "r") as src_zip:
+            out_buffer = _presized_zip_buffer(src_zip)
             with zipfile.ZipFile(out_buffer, "w") as dst_zip:
-                for info in src_zip.infolist():
-                    payload = src_zip.read(info.filename)
-                    current_name = info.filename.replace("\\", "/")
-                    if zip_chain:
-                        if current_name == zip_chain[0]:
-                            payload, updated_meta = self._rewrite_nested_zip_payload(
-                                payload,
-                                zip_chain[1:],
-                                zip_entry_path,
-                                updates,
-                            )
-                    elif current_name == zip_entry_path:
-                        parsed = self._parse_json_bytes(payload)
-                        if parsed is None:
-                            raise ValueError("metadata.json inside nested zip is not an object")
-                        updated_meta = self._apply_updates_to_metadata(parsed, updates)
-                        payload = json.dumps(updated_meta, indent=2, ensure_ascii=True).encode("utf-8")
-                    dst_zip.writestr(info, payload)
-        if updated_meta is None:
-            return zip_payload, None
-        return out_buffer.getvalue(), updated_meta
+                changed = self._rewrite_zip_members(src_zip, dst_zip, edits, results)
+        if not changed:
+            return zip_payload
+        out_buffer.truncate()
+        return out_buffer.getvalue()
 
     def _rewrite_nested_zip_payload_full(
         self,
@@ -1859,12 +3273,15 @@ class SpritePipelineApp(BaseTk):
     ) -> tuple[bytes, bool]:
         replaced = False
         src_buffer = BytesIO(zip_payload)
-        out_buffer = BytesIO()
         with zipfile.ZipFile(src_buffer, "r") as src_zip:
+            out_buffer = _presized_zip_buffer(src_zip)
             with zipfile.ZipFile(out_buffer, "w") as dst_zip:
                 for info in src_zip.infolist():
-                    payload = src_zip.read(info.filename)
                     current_name = info.filename.replace("\\", "/")
+                    if current_name != (zip_chain[0] if zip_chain else zip_entry_path):
+                        _copy_zip_member(src_zip, dst_zip, info)
+                        continue
+                    payload = src_zip.read(info.filename)
                     if zip_chain:
                         if current_name == zip_chain[0]:
                             payload, nested_replaced = self._rewrite_nested_zip_payload_full(
@@ -1877,10 +3294,12 @@ class SpritePipelineApp(BaseTk):
                                 replaced = True
                     elif current_name == zip_entry_path:
                         replaced = True
-                        payload = json.dumps(new_meta, indent=2, ensure_ascii=True).encode("utf-8")
-                    dst_zip.writestr(info, payload)
+                        payload = _encode_json_bytes(new_meta)
+                    target = _rewritten_member_info(info) if zip_chain else _metadata_member_info(info, payload)
+                    dst_zip.writestr(target, payload)
         if not replaced:
             return zip_payload, False
+        out_buffer.truncate()
         return out_buffer.getvalue(), True
 
     def _draw_offsets_legend(self, canvas: Optional[tk.Canvas] = None) -> None:
@@ -1897,25 +3316,19 @@ class SpritePipelineApp(BaseTk):
         offset_x = (dst_w - draw_w) * 0.5
         offset_y = (dst_h - draw_h) * 0.5
 
-        def p(x: float, y: float) -> tuple[float, float]:
-            return (offset_x + x * scale, offset_y + y * scale)
-
         def rect(x: float, y: float, w: float, h: float, color: str) -> None:
-            a = p(x, y)
-            b = p(x + w, y + h)
-            c.create_rectangle(a[0], a[1], b[0], b[1], fill=color, outline="")
-
-        poly = [
-            p(1084.669, 258.213),
-            p(544.669, 514.213),
-            p(4.669, 258.213),
-            p(544.669, 2.213),
-        ]
+            c.create_rectangle(
+                offset_x + x * scale,
+                offset_y + y * scale,
+                offset_x + (x + w) * scale,
+                offset_y + (y + h) * scale,
+                fill=color,
+                outline="",
+            )
+
+        origin = (offset_x, offset_y)
         c.create_polygon(
-            poly[0][0], poly[0][1],
-            poly[1][0], poly[1][1],
-            poly[2][0], poly[2][1],
-            poly[3][0], poly[3][1],
+            *(_LEGEND_DIAMOND_POINTS * scale + origin).ravel().tolist(),
             outline="#231f20",
             fill="",
             width=2,
@@ -1924,131 +3337,26 @@ class SpritePipelineApp(BaseTk):
         rect(904.076, 244.781, 88.31, 26.864, "#ED1C24")
         rect(67.076, 244.781, 88.31, 26.864, "#ED1C24")
 
-        x_path = (
-            "M365.865,366.891l-16.144-27.977c-6.574-10.702-10.702-17.642-14.646-24.965h-0.375"
-            "c-3.57,7.323-7.132,14.08-13.706,25.149l-15.211,27.793H287.01l38.678-64.026l-37.173-62.527"
-            "h18.957l16.71,29.674c4.701,8.255,8.263,14.646,11.642,21.403h0.566c3.57-7.506,6.757-13.331,"
-            "11.451-21.403l17.275-29.674h18.774l-38.487,61.595l39.427,64.958H365.865z"
-        )
-        y_path = (
-            "M730.689,366.891V313.2l-39.993-72.862h18.59l17.826,34.933c4.892,9.57,8.638,17.275,"
-            "12.582,26.096h0.382c3.562-8.271,7.889-16.526,12.765-26.096l18.208-34.933h18.59L747.2,313.001v53.89"
-            "H730.689z"
-        )
-        self._draw_svg_path_fill(c, x_path, p, "#231f20")
-        self._draw_svg_path_fill(c, y_path, p, "#231f20")
+        self._draw_svg_path_fill(c, _LEGEND_X_PATH, offset_x, offset_y, scale, "#231f20")
+        self._draw_svg_path_fill(c, _LEGEND_Y_PATH, offset_x, offset_y, scale, "#231f20")
 
-        plus_points = [
-            p(602.166, 406.897), p(562.16, 406.897), p(562.16, 366.891), p(527.178, 366.891),
-            p(527.178, 406.897), p(487.172, 406.897), p(487.172, 441.879), p(527.178, 441.879),
-            p(527.178, 481.885), p(562.16, 481.885), p(562.16, 441.879), p(602.166, 441.879),
-        ]
-        flat_plus: list[float] = []
-        for px, py in plus_points:
-            flat_plus.extend([px, py])
-        c.create_polygon(*flat_plus, fill="#00A651", outline="")
-
-    def _draw_svg_path_fill(self, canvas: tk.Canvas, path_d: str, transform, fill_color: str, curve_steps: int = 10) -> None:
-        points = self._svg_path_to_points(path_d, curve_steps)
-        if len(points) < 3:
-            return
-        flat: list[float] = []
-        for x, y in points:
-            tx, ty = transform(x, y)
-            flat.extend([tx, ty])
-        canvas.create_polygon(*flat, fill=fill_color, outline="")
+        c.create_polygon(*(_LEGEND_PLUS_POINTS * scale + origin).ravel().tolist(), fill="#00A651", outline="")
 
-    def _svg_path_to_points(self, path_d: str, curve_steps: int = 10) -> list[tuple[float, float]]:
-        tokens = re.findall(r"[A-Za-z]|-?\d*\.?\d+", path_d)
-        i = 0
-        cmd = ""
-        cx = 0.0
-        cy = 0.0
-        sx = 0.0
-        sy = 0.0
-        out: list[tuple[float, float]] = []
-
-        def is_num(tok: str) -> bool:
-            return bool(re.fullmatch(r"-?\d*\.?\d+", tok))
-
-        def cubic(p0, p1, p2, p3, steps: int) -> list[tuple[float, float]]:
-            pts: list[tuple[float, float]] = []
-            for step in range(1, steps + 1):
-                t = step / float(steps)
-                mt = 1.0 - t
-                x = mt * mt * mt * p0[0] + 3.0 * mt * mt * t * p1[0] + 3.0 * mt * t * t * p2[0] + t * t * t * p3[0]
-                y = mt * mt * mt * p0[1] + 3.0 * mt * mt * t * p1[1] + 3.0 * mt * t * t * p2[1] + t * t * t * p3[1]
-                pts.append((x, y))
-            return pts
-
-        while i < len(tokens):
-            tok = tokens[i]
-            if re.fullmatch(r"[A-Za-z]", tok):
-                cmd = tok
-                i += 1
-            if cmd == "":
-                break
-            if cmd == "M":
-                if i + 1 >= len(tokens):
-                    break
-                cx = float(tokens[i]); cy = float(tokens[i + 1]); i += 2
-                sx, sy = cx, cy
-                out.append((cx, cy))
-                cmd = "L"
-            elif cmd == "m":
-                if i + 1 >= len(tokens):
-                    break
-                cx += float(tokens[i]); cy += float(tokens[i + 1]); i += 2
-                sx, sy = cx, cy
-                out.append((cx, cy))
-                cmd = "l"
-            elif cmd == "L":
-                while i + 1 < len(tokens) and is_num(tokens[i]) and is_num(tokens[i + 1]):
-                    cx = float(tokens[i]); cy = float(tokens[i + 1]); i += 2
-                    out.append((cx, cy))
-            elif cmd == "l":
-                while i + 1 < len(tokens) and is_num(tokens[i]) and is_num(tokens[i + 1]):
-                    cx += float(tokens[i]); cy += float(tokens[i + 1]); i += 2
-                    out.append((cx, cy))
-            elif cmd == "H":
-                while i < len(tokens) and is_num(tokens[i]):
-                    cx = float(tokens[i]); i += 1
-                    out.append((cx, cy))
-            elif cmd == "h":
-                while i < len(tokens) and is_num(tokens[i]):
-                    cx += float(tokens[i]); i += 1
-                    out.append((cx, cy))
-            elif cmd == "V":
-                while i < len(tokens) and is_num(tokens[i]):
-                    cy = float(tokens[i]); i += 1
-                    out.append((cx, cy))
-            elif cmd == "v":
-                while i < len(tokens) and is_num(tokens[i]):
-                    cy += float(tokens[i]); i += 1
-                    out.append((cx, cy))
-            elif cmd == "C":
-                while i + 5 < len(tokens) and all(is_num(tokens[i + j]) for j in range(6)):
-                    p0 = (cx, cy)
-                    p1 = (float(tokens[i]), float(tokens[i + 1]))
-                    p2 = (float(tokens[i + 2]), float(tokens[i + 3]))
-                    p3 = (float(tokens[i + 4]), float(tokens[i + 5]))
-                    i += 6
-                    out.extend(cubic(p0, p1, p2, p3, curve_steps))
-                    cx, cy = p3
-            elif cmd == "c":
-                while i + 5 < len(tokens) and all(is_num(tokens[i + j]) for j in range(6)):
-                    p0 = (cx, cy)
-                    p1 = (cx + float(tokens[i]), cy + float(tokens[i + 1]))
-                    p2 = (cx + float(tokens[i + 2]), cy + float(tokens[i + 3]))
-                    p3 = (cx + float(tokens[i + 4]), cy + float(tokens[i + 5]))
-                    i += 6
-                    out.extend(cubic(p0, p1, p2, p3, curve_steps))
-                    cx, cy = p3
-            elif cmd in ("Z", "z"):
-                out.append((sx, sy))
-            else:
-                i += 1
-        return out
+    def _draw_svg_path_fill(
+        self,
+        canvas: tk.Canvas,
+        path_d: str,
+        offset_x: float,
+        offset_y: float,
+        scale: float,
+        fill_color: str,
+        curve_steps: int = 10,
+    ) -> None:
+        pts = _svg_path_array(path_d, curve_steps)
+        if len(pts) < 3:
+            return
+        flat = (pts * scale + (offset_x, offset_y)).ravel().tolist()
+        canvas.create_polygon(*flat, fill=fill_color, outline="")
 
     def _setup_dnd(self) -> None:
         if DND_FILES is None:
@@ -2083,15 +3391,23 @@ class SpritePipelineApp(BaseTk):
             p = str(raw).strip().strip('"').strip("{}")
             if p == "":
                 continue
-            path_obj = Path(p)
-            if path_obj.is_dir():
-                candidates = sorted(path_obj.glob("*.png"))
-            else:
-                candidates = [path_obj]
-            for candidate in candidates:
-                candidate_str = str(candidate)
-                if not candidate_str.lower().endswith(".png"):
+            if os.path.isdir(p):
+                # scandir hands back names with the file type, so one pass
+                # filters without a stat per entry; normcase keeps the old
+                # Path ordering on case-insensitive filesystems.
+                try:
+                    with os.scandir(p) as it:
+                        candidates = sorted(
+                            (e.path for e in it if e.name.lower().endswith(".png") and e.is_file()),
+                            key=os.path.normcase,
+                        )
+                except OSError:
                     continue
+            elif p.lower().endswith(".png"):
+                candidates = [str(Path(p))]
+            else:
+                continue
+            for candidate_str in candidates:
                 key = os.path.normcase(candidate_str)
                 if key in seen:
                     continue
@@ -2102,16 +3418,16 @@ class SpritePipelineApp(BaseTk):
     def _ingest_paths(self, paths: list[str]) -> None:
         if not paths:
             return
-        existing = {os.path.normcase(it.source_path) for it in self.items}
         added = 0
         for path in paths:
-            if os.path.normcase(path) in existing:
+            key = os.path.normcase(path)
+            if key in self._item_paths:
                 continue
             try:
                 item = SpriteImageItem.from_path(path)
                 self._auto_align_item_guides(item)
                 self.items.append(item)
-                existing.add(os.path.normcase(path))
+                self._item_paths.add(key)
                 added += 1
             except Exception as exc:
                 self.status_var.set(f"Skip {Path(path).name}: {exc}")
@@ -2141,41 +3457,37 @@ class SpritePipelineApp(BaseTk):
         self._request_render()
         self.status_var.set(f"Auto-aligned guides for {len(self.items)} image(s).")
 
+    def _auto_guides_for_item(self, item: SpriteImageItem) -> Optional[tuple[float, float, float, float]]:
+        # Only the four results are kept; the geometry arrays behind them are
+        # several times the size of the alpha channel.
+        try:
+            st = os.stat(item.source_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        cached = self._auto_guides_cache.get(item.source_path)
+        if stamp is not None and cached is not None and cached[:2] == stamp:
+            return cached[2]
+        geo = _compute_alpha_geometry(item.alpha_array(), EXPORT_ALPHA_TRIM_THRESHOLD)
+        guides = None if geo is None else self._auto_guides_from_geometry(geo)
+        if stamp is not None:
+            self._auto_guides_cache[item.source_path] = (stamp[0], stamp[1], guides)
+        return guides
+
     def _auto_align_item_guides(self, item: SpriteImageItem) -> None:
-        img = item.source_rgba()
-        alpha = img.getchannel("A")
-        pix = alpha.load()
-        w, h = alpha.size
-        if w <= 0 or h <= 0:
-            return
-        threshold = EXPORT_ALPHA_TRIM_THRESHOLD
-
-        bottom_y = -1
-        for y in range(h - 1, -1, -1):
-            found = False
-            for x in range(w):
-                if pix[x, y] >= threshold:
-                    found = True
-                    break
-            if found:
-                bottom_y = y
-                break
-        if bottom_y < 0:
+        guides = self._auto_guides_for_item(item)
+        if guides is None:
             return
+        item.guide_center, item.guide_left, item.guide_right, item.baseline_y = guides
 
-        bottom_xs = [x for x in range(w) if pix[x, bottom_y] >= threshold]
-        if bottom_xs:
-            left_bottom = min(bottom_xs)
-            right_bottom = max(bottom_xs)
-            center = (left_bottom + right_bottom + 1.0) * 0.5
-        else:
-            center = w * 0.5
-            left_bottom = 0
-            right_bottom = w - 1
+    def _auto_guides_from_geometry(self, geo: AlphaGeo) -> tuple[float, float, float, float]:
+        left_bottom = int(geo.row_left[-1])
+        right_bottom = int(geo.row_right[-1])
+        center = (left_bottom + right_bottom + 1.0) * 0.5
 
         left_guide = float(left_bottom)
         right_guide = float(right_bottom)
-        left_auto, right_auto = self._detect_plate_side_edges(alpha, threshold)
+        left_auto, right_auto = self._detect_plate_side_edges(geo)
         if left_auto is not None:
             left_guide = left_auto
         if right_auto is not None:
@@ -2185,77 +3497,42 @@ class SpritePipelineApp(BaseTk):
             left_guide = float(left_bottom)
             right_guide = float(max(left_bottom + 1, right_bottom))
 
-        item.guide_center = center
-        item.guide_left = left_guide
-        item.guide_right = right_guide
-        item.baseline_y = float(h)
-
-    def _detect_plate_side_edges(self, alpha: Image.Image, threshold: int) -> tuple[Optional[float], Optional[float]]:
-        pix = alpha.load()
-        w, h = alpha.size
-        if w <= 0 or h <= 0:
-            return (None, None)
-
-        bottom_y = -1
-        for y in range(h - 1, -1, -1):
-            has_opaque = False
-            for x in range(w):
-                if pix[x, y] >= threshold:
-                    has_opaque = True
-                    break
-            if has_opaque:
-                bottom_y = y
-                break
-        if bottom_y < 0:
-            return (None, None)
-
-        row_bounds: dict[int, tuple[int, int]] = {}
-        for y in range(h):
-            left = None
-            right = None
-            for x in range(w):
-                if pix[x, y] >= threshold:
-                    left = x
-                    break
-            if left is None:
-                continue
-            for x in range(w - 1, -1, -1):
-                if pix[x, y] >= threshold:
-                    right = x
-                    break
-            if right is None:
-                continue
-            row_bounds[y] = (left, right)
+        return (center, left_guide, right_guide, float(geo.height))
+
+    def _detect_plate_side_edges(self, geo: AlphaGeo) -> tuple[Optional[float], Optional[float]]:
+        run_px = AUTO_EDGE_OPAQUE_RUN_PX
 
         def outside_transparent_run_down(x: int, start_y: int) -> int:
-            if x < 0 or x >= w:
-                return h - start_y
-            run = 0
-            y = start_y
-            while y < h and pix[x, y] < threshold:
-                run += 1
-                y += 1
-            return run
+            # Length of the transparent run starting at (x, start_y) going down;
+            # a run that leaves the box continues through the transparent rows
+            # below it. Only a handful of candidates are ever checked, so one
+            # column slice each beats a whole-box run table.
+            if x < geo.left_x or x > geo.right_x:
+                return geo.height - start_y
+            column = geo.mask[start_y - geo.top_y:, x - geo.left_x]
+            hit = int(column.argmax())
+            if not column[hit]:
+                return geo.height - start_y
+            return hit
 
         def find_vertical_side_edge(is_left: bool) -> Optional[float]:
-            min_y = AUTO_EDGE_OPAQUE_RUN_PX - 1
-            for y in range(bottom_y, min_y - 1, -1):
-                xs: list[int] = []
-                ok = True
-                for k in range(AUTO_EDGE_OPAQUE_RUN_PX):
-                    yy = y - k
-                    bounds = row_bounds.get(yy, None)
-                    if bounds is None:
-                        ok = False
-                        break
-                    xs.append(bounds[0] if is_left else bounds[1])
-                if not ok:
-                    continue
-                if max(xs) - min(xs) > 1:
-                    continue
-                edge_x = int(round(sum(xs) / float(len(xs))))
+            # Window i covers box rows i..i+run_px-1, i.e. it ends at image row
+            # top_y + i + run_px - 1. A window qualifies when every row has
+            # opaque pixels and the edge wobbles by at most 1px; candidates
+            # are then tried bottom-up like the old per-row scan.
+            if geo.mask.shape[0] < run_px:
+                return None
+            windows = np.lib.stride_tricks.sliding_window_view(geo.row_left if is_left else geo.row_right, run_px)
+            ok = np.lib.stride_tricks.sliding_window_view(geo.row_present, run_px).all(axis=1)
+            ok &= windows.max(axis=1) - windows.min(axis=1) <= 1
+            candidates = np.flatnonzero(ok)
+            if candidates.size == 0:
+                return None
+            edge_xs = np.round(windows.sum(axis=1) / float(run_px))
+            for i in candidates[::-1].tolist():
+                edge_x = int(edge_xs[i])
                 outside_x = edge_x - 1 if is_left else edge_x + 1
-                if outside_transparent_run_down(outside_x, y) >= AUTO_SIDE_TRANSPARENCY_PX:
+                if outside_transparent_run_down(outside_x, geo.top_y + i + run_px - 1) >= AUTO_SIDE_TRANSPARENCY_PX:
                     return float(edge_x)
             return None
 
@@ -2287,9 +3564,11 @@ class SpritePipelineApp(BaseTk):
         self._sync_zip_name_to_id()
 
     def _refresh_image_list(self) -> None:
+        # One Tcl insert for the whole list instead of a round-trip per item.
+        labels = [f"{idx + 1}. {item.label()}" for idx, item in enumerate(self.items)]
         self.listbox.delete(0, tk.END)
-        for idx, item in enumerate(self.items):
-            self.listbox.insert(tk.END, f"{idx + 1}. {item.label()}")
+        if labels:
+            self.listbox.insert(tk.END, *labels)
         if self.active_idx is not None and 0 <= self.active_idx < len(self.items):
             self.listbox.selection_set(self.active_idx)
             self.listbox.see(self.active_idx)
@@ -2426,7 +3705,10 @@ class SpritePipelineApp(BaseTk):
     def _remove_selected(self) -> None:
         if self.active_idx is None:
             return
-        del self.items[self.active_idx]
+        removed = self.items.pop(self.active_idx)
+        removed.scaled_previews().clear()
+        self._item_paths.discard(os.path.normcase(removed.source_path))
+        self._auto_guides_cache.pop(removed.source_path, None)
         if not self.items:
             self.active_idx = None
         else:
@@ -2441,7 +3723,7 @@ class SpritePipelineApp(BaseTk):
         self._apply_zoom_at_canvas_point(new_zoom, self._last_canvas_mouse[0], self._last_canvas_mouse[1], old_zoom)
         self.preview_zoom = new_zoom
         self.zoom_var.set(self.preview_zoom * 100.0)
-        self._schedule_zoom_render()
+        self._request_render()
 
     def _on_mousewheel_zoom(self, event) -> None:
         self._last_canvas_mouse = (float(event.x), float(event.y))
@@ -2451,7 +3733,7 @@ class SpritePipelineApp(BaseTk):
         self._apply_zoom_at_canvas_point(new_zoom, float(event.x), float(event.y), old_zoom)
         self.preview_zoom = new_zoom
         self.zoom_var.set(self.preview_zoom * 100.0)
-        self._schedule_zoom_render()
+        self._request_render()
 
     def _apply_zoom_at_canvas_point(self, new_zoom: float, canvas_x: float, canvas_y: float, old_zoom: Optional[float] = None) -> None:
         item = self._active_item()
@@ -2480,26 +3762,6 @@ class SpritePipelineApp(BaseTk):
         self.pan_x = new_pan_x
         self.pan_y = new_pan_y
 
-    def _schedule_zoom_render(self) -> None:
-        # Coalesce rapid wheel/slider events so we render at controlled cadence.
-        if self._zoom_render_after_id is not None:
-            self.after_cancel(self._zoom_render_after_id)
-        self._zoom_render_after_id = self.after(25, self._flush_zoom_render)
-
-    def _flush_zoom_render(self) -> None:
-        self._zoom_render_after_id = None
-        self._request_render()
-
-    def _schedule_pan_render(self) -> None:
-        if self._pan_render_after_id is not None:
-            return
-        # Refresh viewport tile while panning without flooding render queue.
-        self._pan_render_after_id = self.after(33, self._flush_pan_render)
-
-    def _flush_pan_render(self) -> None:
-        self._pan_render_after_id = None
-        self._request_render()
-
     def _on_canvas_motion(self, event) -> None:
         self._last_canvas_mouse = (float(event.x), float(event.y))
 
@@ -2507,28 +3769,27 @@ class SpritePipelineApp(BaseTk):
         return min(PREVIEW_MAX_ZOOM_FALLBACK, max(PREVIEW_MIN_ZOOM, requested_zoom))
 
     def _request_render(self) -> None:
-        if self._render_pending:
-            return
-        self._render_pending = True
-        self.after_idle(self._enqueue_preview_job)
+        # Just mark the preview dirty; the 16ms poll tick submits at most one
+        # job per frame, so bursts of wheel/drag events coalesce into one render.
+        self._preview_dirty = True
 
     def _enqueue_preview_job(self) -> None:
-        self._render_pending = False
         item = self._active_item()
         if item is None:
-            self.canvas.delete("all")
-            self._canvas_image_id = None
-            self._canvas_rect_id = None
-            self._canvas_left_id = None
-            self._canvas_center_id = None
-            self._canvas_right_id = None
-            self.canvas.create_text(
-                20,
-                20,
-                anchor="nw",
-                fill="#9a9a9a",
-                text="Add PNGs.\nOrder is used for export naming (1,2,3,4...).",
-            )
+            if self._scene_visible:
+                self.canvas.itemconfigure("scene", state="hidden")
+                self._scene_visible = False
+            if self._canvas_hint_id is None:
+                self._canvas_hint_id = self.canvas.create_text(
+                    20,
+                    20,
+                    anchor="nw",
+                    fill="#9a9a9a",
+                    text="Add PNGs.\nOrder is used for export naming (1,2,3,4...).",
+                )
+            else:
+                self.canvas.coords(self._canvas_hint_id, 20, 20)
+                self.canvas.itemconfigure(self._canvas_hint_id, state="normal")
             self._record_fps(0.001)
             return
 
@@ -2538,6 +3799,8 @@ class SpritePipelineApp(BaseTk):
         job = {
             "job_id": self._preview_job_id,
             "source": item.source_rgba(),
+            "mips": item.mip_levels(),
+            "scaled": item.scaled_previews(),
             "img_w": item.width,
             "img_h": item.height,
             "zoom": self.preview_zoom,
@@ -2555,6 +3818,18 @@ class SpritePipelineApp(BaseTk):
         self._preview_event.set()
 
     def _preview_worker_loop(self) -> None:
+        # Last rendered frame: jobs that only move an already-visible scene
+        # (pan with the whole sprite on screen, guide edits) reuse its pixels.
+        last_source: Optional[Image.Image] = None
+        last_key: Optional[tuple] = None
+        last_preview: Optional[Image.Image] = None
+        # Whole-sprite resamples at a given display size live in each item's
+        # scaled_previews(), so panning at a fixed zoom is a crop instead of a
+        # resample. Built on the second job at the same size so wheel zooming
+        # (a new size per job) stays viewport-bound. scaled_lru orders every
+        # entry across items (oldest first) for the shared byte budget.
+        scaled_lru: list[tuple[dict, tuple, int]] = []
+        last_scale_key: Optional[tuple] = None
         while not self._preview_shutdown:
             self._preview_event.wait()
             if self._preview_shutdown:
@@ -2578,36 +3853,124 @@ class SpritePipelineApp(BaseTk):
                 src_w = int(job["img_w"])
                 src_h = int(job["img_h"])
 
-                # Render only the visible source region for fast zoom/pan on large images.
-                src_x0 = max(0.0, (-ox) / zoom)
-                src_y0 = max(0.0, (-oy) / zoom)
-                src_x1 = min(float(src_w), (cw - ox) / zoom)
-                src_y1 = min(float(src_h), (ch - oy) / zoom)
-
-                if src_x1 <= src_x0 or src_y1 <= src_y0:
+                # Render only the part of the scene that lands inside the canvas:
+                # the scene is snapped to whole canvas pixels, the output is
+                # clipped to the viewport and only the matching fractional
+                # source box is resampled, so cost tracks viewport size rather
+                # than zoom (no partially offscreen edge pixels).
+                scene_x = int(math.floor(ox + 0.5))
+                scene_y = int(math.floor(oy + 0.5))
+                scale_x = disp_w / src_w
+                scale_y = disp_h / src_h
+                view_x0 = max(0, scene_x)
+                view_y0 = max(0, scene_y)
+                view_x1 = min(cw, scene_x + disp_w)
+                view_y1 = min(ch, scene_y + disp_h)
+
+                render_key = (
+                    zoom,
+                    disp_w,
+                    disp_h,
+                    view_x0 - scene_x,
+                    view_y0 - scene_y,
+                    view_x1 - scene_x,
+                    view_y1 - scene_y,
+                )
+                if view_x1 <= view_x0 or view_y1 <= view_y0:
                     preview = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
                     draw_x = 0.0
                     draw_y = 0.0
+                elif job["source"] is last_source and render_key == last_key and last_preview is not None:
+                    preview = last_preview
+                    draw_x = float(view_x0)
+                    draw_y = float(view_y0)
+                elif disp_w == src_w and disp_h == src_h:
+                    # 1:1 is exactly what NEAREST would sample; a crop skips the resampler.
+                    preview = job["source"].crop(
+                        (view_x0 - scene_x, view_y0 - scene_y, view_x1 - scene_x, view_y1 - scene_y)
+                    )
+                    draw_x = float(view_x0)
+                    draw_y = float(view_y0)
                 else:
-                    crop_l = int(math.floor(src_x0))
-                    crop_t = int(math.floor(src_y0))
-                    crop_r = int(math.ceil(src_x1))
-                    crop_b = int(math.ceil(src_y1))
-                    crop_l = max(0, min(src_w, crop_l))
-                    crop_t = max(0, min(src_h, crop_t))
-                    crop_r = max(crop_l + 1, min(src_w, crop_r))
-                    crop_b = max(crop_t + 1, min(src_h, crop_b))
-                    crop = job["source"].crop((crop_l, crop_t, crop_r, crop_b))
-                    target_w = max(1, int(round((crop_r - crop_l) * zoom)))
-                    target_h = max(1, int(round((crop_b - crop_t) * zoom)))
-                    # Pixel-precise mode when zoomed in, smoother downsample when zoomed out.
+                    # Pixel-precise mode when zoomed in, smoother downsample when
+                    # zoomed out; past 1/2 the mip level already did the heavy
+                    # averaging, so the cheaper BOX area filter finishes it.
                     if zoom >= 1.0:
                         resample = Image.Resampling.NEAREST
+                    elif zoom < 0.5:
+                        resample = Image.Resampling.BOX
                     else:
                         resample = Image.Resampling.BILINEAR
-                    preview = crop.resize((target_w, target_h), resample)
-                    draw_x = ox + crop_l * zoom
-                    draw_y = oy + crop_t * zoom
+                    source = job["source"]
+                    item_scaled = job["scaled"]
+                    size_key = (disp_w, disp_h, int(resample))
+                    scale_key = (id(source),) + size_key
+                    cached = item_scaled.get(size_key)
+                    # Entries the app cleared (item removed) drop out here.
+                    scaled_lru = [
+                        entry for entry in scaled_lru
+                        if entry[1] in entry[0] and not (entry[0] is item_scaled and entry[1] == size_key)
+                    ]
+                    if cached is not None:
+                        scaled_lru.append((item_scaled, size_key, disp_w * disp_h * 4))
+                    elif (
+                        scale_key == last_scale_key
+                        and disp_w * disp_h * 4 <= PREVIEW_SCALED_CACHE_MAX_BYTES
+                    ):
+                        # Same filter path as a clipped frame, just over the
+                        # whole sprite, so the first and later frames match.
+                        if resample == Image.Resampling.NEAREST:
+                            scaled = source.resize((disp_w, disp_h), resample)
+                        else:
+                            scaled = _resample_from_mips(
+                                source, job["mips"], zoom, (0.0, 0.0, float(src_w), float(src_h)), (disp_w, disp_h), resample
+                            )
+                        cached = scaled
+                        item_scaled[size_key] = scaled
+                        scaled_lru.append((item_scaled, size_key, disp_w * disp_h * 4))
+                        total = sum(entry[2] for entry in scaled_lru)
+                        while total > PREVIEW_SCALED_CACHE_MAX_BYTES:
+                            old_cache, old_key, old_bytes = scaled_lru.pop(0)
+                            old_cache.pop(old_key, None)
+                            total -= old_bytes
+                    last_scale_key = scale_key
+                    if cached is not None:
+                        preview = cached.crop(
+                            (view_x0 - scene_x, view_y0 - scene_y, view_x1 - scene_x, view_y1 - scene_y)
+                        )
+                    else:
+                        src_x0 = (view_x0 - scene_x) / scale_x
+                        src_y0 = (view_y0 - scene_y) / scale_y
+                        src_x1 = min(float(src_w), (view_x1 - scene_x) / scale_x)
+                        src_y1 = min(float(src_h), (view_y1 - scene_y) / scale_y)
+                        if resample == Image.Resampling.NEAREST:
+                            # NEAREST samples the float box straight from the
+                            # source, so no intermediate crop is allocated.
+                            preview = source.resize(
+                                (view_x1 - view_x0, view_y1 - view_y0),
+                                resample,
+                                box=(src_x0, src_y0, src_x1, src_y1),
+                            )
+                        else:
+                            preview = _resample_from_mips(
+                                source,
+                                job["mips"],
+                                zoom,
+                                (src_x0, src_y0, src_x1, src_y1),
+                                (view_x1 - view_x0, view_y1 - view_y0),
+                                resample,
+                            )
+                    draw_x = float(view_x0)
+                    draw_y = float(view_y0)
+                if preview is not last_preview:
+                    # Flatten onto the canvas background here, so the UI thread
+                    # blits opaque RGB into the Tk photo with no alpha pass.
+                    flat = Image.new("RGB", preview.size, PREVIEW_BG_RGB)
+                    flat.paste(preview, (0, 0), preview)
+                    preview = flat
+                last_source = job["source"]
+                last_key = render_key
+                last_preview = preview
 
                 result = {
                     "job_id": int(job["job_id"]),
@@ -2636,35 +3999,64 @@ class SpritePipelineApp(BaseTk):
                 result = self._preview_latest_result
         if result is not None:
             self._apply_preview_result(result)
+        if self._preview_dirty and self._preview_applied_job_id >= self._preview_job_id:
+            self._preview_dirty = False
+            self._enqueue_preview_job()
         if not self._preview_shutdown:
             self.after(16, self._poll_preview_results)
 
     def _apply_preview_result(self, result: dict) -> None:
         self._preview_applied_job_id = int(result["job_id"])
-        self.canvas.delete("all")
-        self.preview_photo = ImageTk.PhotoImage(result["preview"])
+        preview = result["preview"]
+        photo = self.preview_photo
+        if photo is not None and preview is self._preview_photo_image:
+            # Worker reused the previous frame's pixels; the photo already holds them.
+            pass
+        elif photo is not None:
+            # Keep one Tk photo for the session and blit into it. A size change
+            # only reconfigures the Tk image's dimensions, so the paste covers it.
+            if self._preview_photo_size != preview.size:
+                photo.tk.call(str(photo), "configure", "-width", preview.width, "-height", preview.height)
+                self._preview_photo_size = preview.size
+            photo.paste(preview)
+        else:
+            self.preview_photo = ImageTk.PhotoImage(preview)
+            self._preview_photo_size = preview.size
+        self._preview_photo_image = preview
         self._scene_ox = float(result["ox"])
         self._scene_oy = float(result["oy"])
         self._scene_disp_w = int(result["disp_w"])
         self._scene_disp_h = int(result["disp_h"])
         draw_x = float(result.get("draw_x", self._scene_ox))
         draw_y = float(result.get("draw_y", self._scene_oy))
-        self._canvas_image_id = self.canvas.create_image(
-            draw_x,
-            draw_y,
-            image=self.preview_photo,
-            anchor="nw",
-        )
-        self._canvas_rect_id = self.canvas.create_rectangle(
+        rect = (
             self._scene_ox,
             self._scene_oy,
             self._scene_ox + self._scene_disp_w,
             self._scene_oy + self._scene_disp_h,
-            outline="#4f4f4f",
         )
-        self._canvas_left_id = self.canvas.create_line(0, 0, 0, 0, fill="#32cd32", width=2)
-        self._canvas_center_id = self.canvas.create_line(0, 0, 0, 0, fill="#ff3b30", width=2)
-        self._canvas_right_id = self.canvas.create_line(0, 0, 0, 0, fill="#32cd32", width=2)
+        if self._canvas_image_id is None:
+            # The item shows the session's single photo, so later frames only
+            # need to move it; pasted pixels show up on their own.
+            self._canvas_image_id = self.canvas.create_image(
+                draw_x,
+                draw_y,
+                image=self.preview_photo,
+                anchor="nw",
+                tags=("scene",),
+            )
+            self._canvas_rect_id = self.canvas.create_rectangle(*rect, outline="#4f4f4f", tags=("scene",))
+            self._canvas_left_id = self.canvas.create_line(0, 0, 0, 0, fill="#32cd32", width=2, tags=("scene",))
+            self._canvas_center_id = self.canvas.create_line(0, 0, 0, 0, fill="#ff3b30", width=2, tags=("scene",))
+            self._canvas_right_id = self.canvas.create_line(0, 0, 0, 0, fill="#32cd32", width=2, tags=("scene",))
+        else:
+            self.canvas.coords(self._canvas_image_id, draw_x, draw_y)
+            self.canvas.coords(self._canvas_rect_id, *rect)
+        if not self._scene_visible:
+            self.canvas.itemconfigure("scene", state="normal")
+            if self._canvas_hint_id is not None:
+                self.canvas.itemconfigure(self._canvas_hint_id, state="hidden")
+            self._scene_visible = True
         self._update_overlay_positions()
         self._record_fps(float(result["frame_dt"]))
         item = self._active_item()
@@ -2690,31 +4082,50 @@ class SpritePipelineApp(BaseTk):
     def _pan_scene(self, dx: float, dy: float) -> None:
         if dx == 0 and dy == 0:
             return
-        if self._canvas_image_id is None:
+        if not self._scene_visible:
             return
         self.pan_x += dx
         self.pan_y += dy
         self._scene_ox += dx
         self._scene_oy += dy
-        self.canvas.move("all", dx, dy)
+        # Only the scene items move; the hidden "Add PNGs" hint keeps its place.
+        self.canvas.move("scene", dx, dy)
 
     def _record_fps(self, frame_dt: float) -> None:
         if frame_dt <= 0:
             return
         now = time.perf_counter()
-        self._fps_times.append(now)
-        if len(self._fps_times) >= 2:
-            elapsed = self._fps_times[-1] - self._fps_times[0]
-            fps = (len(self._fps_times) - 1) / elapsed if elapsed > 0 else 0.0
+        times = self._fps_times
+        size = len(times)
+        times[self._fps_index] = now
+        self._fps_index = (self._fps_index + 1) % size
+        self._fps_count = min(size, self._fps_count + 1)
+        oldest = times[self._fps_index] if self._fps_count == size else times[0]
+        # The label is a Tk round trip; a few updates per second is plenty.
+        if now - self._fps_label_time < 0.25:
+            return
+        self._fps_label_time = now
+        if self._fps_count >= 2:
+            elapsed = now - oldest
+            fps = (self._fps_count - 1) / elapsed if elapsed > 0 else 0.0
             self._fps_text.set(f"FPS: {fps:5.1f}   frame {frame_dt*1000:5.1f} ms")
         else:
             self._fps_text.set(f"FPS: --   frame {frame_dt*1000:5.1f} ms")
 
-    def _canvas_to_image_xy(self, x: float, y: float) -> tuple[float, float]:
-        item = self._active_item()
+    def _canvas_to_image_xy(
+        self, x: float, y: float, item: Optional[SpriteImageItem] = None
+    ) -> tuple[float, float]:
+        if item is None:
+            item = self._active_item()
         if item is None:
             return (0.0, 0.0)
         zoom = self.preview_zoom
+        if self._scene_visible:
+            # Invert the same scene transform the guide overlays are drawn
+            # with; _scene_ox/_scene_oy track pans live, so drags need no Tk
+            # size queries.
+            inv_zoom = 1.0 / zoom
+            return ((x - self._scene_ox) * inv_zoom, (y - self._scene_oy) * inv_zoom)
         disp_w = item.width * zoom
         disp_h = item.height * zoom
         cw = max(1, self.canvas.winfo_width())
@@ -2727,7 +4138,8 @@ class SpritePipelineApp(BaseTk):
         item = self._active_item()
         if item is None:
             return
-        ix, _iy = self._canvas_to_image_xy(event.x, event.y)
+        self._drag_item = item
+        ix, _iy = self._canvas_to_image_xy(event.x, event.y, item)
         hit = 10.0 / max(self.preview_zoom, 0.08)
         if abs(ix - item.guide_left) <= hit:
             self.drag_mode = "guide_left"
@@ -2740,10 +4152,10 @@ class SpritePipelineApp(BaseTk):
             self._pan_last = (event.x, event.y)
 
     def _on_canvas_drag(self, event) -> None:
-        item = self._active_item()
+        item = self._drag_item
         if item is None or self.drag_mode is None:
             return
-        ix, _iy = self._canvas_to_image_xy(event.x, event.y)
+        ix, _iy = self._canvas_to_image_xy(event.x, event.y, item)
         if self.drag_mode == "guide_left":
             item.guide_left = min(max(0.0, ix), item.guide_right - 1.0)
             self.image_vars["guide_left"].set(f"{item.guide_left:.2f}")
@@ -2760,27 +4172,21 @@ class SpritePipelineApp(BaseTk):
             last_x, last_y = self._pan_last
             self._pan_scene(event.x - last_x, event.y - last_y)
             self._pan_last = (event.x, event.y)
-            self._schedule_pan_render()
+            self._request_render()
 
     def _on_canvas_release(self, _event) -> None:
         if self.drag_mode == "pan":
             self._request_render()
         self.drag_mode = None
+        self._drag_item = None
 
     def _on_close(self) -> None:
         self._hide_hover_tooltip()
-        if self._zoom_render_after_id is not None:
-            try:
-                self.after_cancel(self._zoom_render_after_id)
-            except Exception:
-                pass
-            self._zoom_render_after_id = None
-        if self._pan_render_after_id is not None:
-            try:
-                self.after_cancel(self._pan_render_after_id)
-            except Exception:
-                pass
-            self._pan_render_after_id = None
+        self._evict_zip_cache()
+        if self._bulk_summary_pool is not None:
+            self._bulk_summary_pool.shutdown(wait=False, cancel_futures=True)
+        if self._export_pool is not None:
+            self._export_pool.shutdown(wait=False, cancel_futures=True)
         self._preview_shutdown = True
         self._preview_event.set()
         self.destroy()
@@ -2797,27 +4203,12 @@ class SpritePipelineApp(BaseTk):
     def _image_ext(self) -> str:
         return "webp" if self.export_format_var.get().strip().lower() == "webp" else "png"
 
-    def _save_encoded(self, image: Image.Image, path: Path) -> None:
-        ext = path.suffix.lower()
-        if ext == ".webp":
-            save_kwargs = self._webp_save_kwargs()
-            image.save(path, format="WEBP", **save_kwargs)
-        else:
-            image.save(path, format="PNG")
-
-    def _encode_bytes(self, image: Image.Image, ext: str) -> bytes:
-        b = BytesIO()
-        if ext == "webp":
-            save_kwargs = self._webp_save_kwargs()
-            image.save(b, format="WEBP", **save_kwargs)
-        else:
-            image.save(b, format="PNG")
-        return b.getvalue()
-
     def _webp_save_kwargs(self) -> dict:
         lossless = bool(self.webp_lossless_var.get())
         kwargs = {
-            "method": 6,
+            # libwebp method 6 is several times slower than 4 for a ~1% smaller
+            # file; it is only worth it for final release builds.
+            "method": 6 if self.webp_max_compression_var.get() else 4,
             "lossless": lossless,
             # Keep RGB in transparent areas to avoid fringe/matte shifts.
             "exact": True,
@@ -2827,76 +4218,10 @@ class SpritePipelineApp(BaseTk):
             kwargs["quality"] = max(1, min(100, _safe_int(self.webp_quality_var.get(), 95)))
         return kwargs
 
-    def _export_sprite_image(self, item: SpriteImageItem) -> Image.Image:
-        src = item.source_rgba()
-        target_span = max(1.0, item.effective_target_span())
-        measured_span = max(1e-6, item.measured_span())
-        target_span_i = int(round(target_span))
-
-        # Strict guide-driven solve: choose integer width that makes the
-        # scaled guide span land exactly on target integer pixels when possible.
-        nominal_sw = max(1, _round_half_up(item.width * (target_span / measured_span)))
-        best_sw = nominal_sw
-        best_err = float("inf")
-        for dsw in range(-128, 129):
-            cand_sw = max(1, nominal_sw + dsw)
-            cand_scale = float(cand_sw) / float(max(1, item.width))
-            cand_span = measured_span * cand_scale
-            cand_span_i = int(round(cand_span))
-            err = abs(cand_span_i - target_span_i) * 1000.0 + abs(cand_span - target_span)
-            if err < best_err:
-                best_err = err
-                best_sw = cand_sw
-                if cand_span_i == target_span_i:
-                    break
-
-        sw = max(1, best_sw)
-        scale_x = float(sw) / float(max(1, item.width))
-        scale_y = scale_x
-        sh = max(1, _round_half_up(item.height * scale_y))
-        # Match Photoshop-style interpolation more closely for edge stability.
-        scaled = src.resize((sw, sh), Image.Resampling.BICUBIC)
-
-        # Match Photoshop action behavior by using actual sprite pixel bounds,
-        # not the full canvas size, when computing output dimensions.
-        # Ignore very faint antialias fringe when computing bounds so
-        # bottom alignment matches Photoshop-like visual edges.
-        alpha = scaled.getchannel("A")
-        # Use a tighter threshold for bounds so tiny AA fringe does not inflate width.
-        alpha_mask = alpha.point(lambda a: 255 if a >= EXPORT_BOUNDS_ALPHA_THRESHOLD else 0)
-        alpha_bbox = alpha_mask.getbbox()
-        if alpha_bbox is None:
-            alpha_left = 0.0
-            alpha_top = 0.0
-            alpha_right = float(sw)
-            alpha_bottom = float(sh)
-        else:
-            alpha_left = float(alpha_bbox[0])
-            alpha_top = float(alpha_bbox[1])
-            alpha_right = float(alpha_bbox[2])
-            alpha_bottom = float(alpha_bbox[3])
-
-        center_scaled = item.guide_center * scale_x
-        baseline_scaled = item.baseline_y * scale_y
-
-        dist_left = max(0.0, center_scaled - alpha_left)
-        dist_right = max(0.0, alpha_right - center_scaled)
-        half_w = max(dist_left, dist_right) + FIXED_PADDING_PX
-        out_w = max(1, int(math.ceil(half_w * 2.0)))
-        # Keep center anchor on an exact pixel to prevent 1px L/R wobble.
-        if out_w % 2 != 0:
-            out_w += 1
-
-        # Vertical rule: 32px top padding, 0px bottom padding.
-        # Visible sprite bounds must touch the output bottom edge.
-        alpha_h = max(1.0, alpha_bottom - alpha_top)
-        out_h = max(1, int(math.ceil(alpha_h + FIXED_PADDING_PX)))
-
-        paste_x = _round_half_up(out_w * 0.5 - center_scaled)
-        paste_y = _round_half_up(out_h - alpha_bottom)
-        out = Image.new("RGBA", (out_w, out_h), (0, 0, 0, 0))
-        out.alpha_composite(scaled, (paste_x, paste_y))
-        return out
+    def _png_save_kwargs(self) -> dict:
+        # zlib level 1 is several times faster than Pillow's default 6 and
+        # only a few percent larger on sprite art; 0 stores uncompressed.
+        return {"compress_level": max(0, min(9, _safe_int(self.png_compress_level_var.get(), 1)))}
 
     def _build_pack_metadata_json(self) -> dict:
         self._apply_pack_metadata_fields()
@@ -2908,46 +4233,111 @@ class SpritePipelineApp(BaseTk):
             return
         target = Path(out_dir) / "metadata.json"
         try:
-            with target.open("w", encoding="utf-8") as f:
-                json.dump(self._build_pack_metadata_json(), f, indent=2, ensure_ascii=True)
+            _dump_json(self._build_pack_metadata_json(), target)
         except Exception as exc:
             messagebox.showerror("Export metadata", f"Failed to write metadata.json:\n{exc}")
             return
         self.status_var.set(f"Metadata updated: {target}")
 
+    def _start_export_jobs(self, ext: str, on_done) -> None:
+        save_kwargs = self._webp_save_kwargs() if ext == "webp" else self._png_save_kwargs()
+        jobs = [
+            {
+                # Drop cached pixels so only the guide settings are pickled; the
+                # worker reloads the source (through the RGBA disk cache).
+                "item": replace(item, _source_rgba=None, _alpha_np=None, _mip_levels=None, _scaled_previews=None),
+                "index": idx,
+                "ext": ext,
+                "save_kwargs": save_kwargs,
+            }
+            for idx, item in enumerate(self.items, start=1)
+        ]
+        labels = [item.label() for item in self.items]
+        if self._export_pool is None:
+            # Spawn, not fork: forking this multi-threaded Tk process (preview
+            # worker, bulk pools) can hand workers locks held mid-operation.
+            self._export_pool = ProcessPoolExecutor(
+                max_workers=max(1, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        futures = [self._export_pool.submit(_export_job_worker, job) for job in jobs]
+        self._export_futures = futures
+        self.status_var.set(f"Exporting {len(jobs)} image(s)...")
+        self.after(50, lambda: self._poll_export_jobs(futures, labels, on_done))
+
+    def _poll_export_jobs(self, futures: list, labels: list[str], on_done) -> None:
+        done = sum(1 for future in futures if future.done())
+        if done < len(futures):
+            self.status_var.set(f"Exporting images: {done}/{len(futures)}...")
+            self.after(50, lambda: self._poll_export_jobs(futures, labels, on_done))
+            return
+        self._export_futures = None
+        encoded: list[tuple[str, bytes]] = []
+        exported = 0
+        errors: list[str] = []
+        for label, future in zip(labels, futures):
+            exc = future.exception()
+            if exc is not None:
+                if isinstance(exc, BrokenProcessPool) and self._export_pool is not None:
+                    # A worker died; start a fresh pool on the next export.
+                    self._export_pool.shutdown(wait=False, cancel_futures=True)
+                    self._export_pool = None
+                errors.append(f"{label}: {exc}")
+                continue
+            encoded.extend(future.result())
+            exported += 1
+        on_done(encoded, exported, errors)
+
+    def _export_busy(self) -> bool:
+        if self._export_futures is not None:
+            messagebox.showinfo("Export", "An export is already running.")
+            return True
+        return False
+
     def _export_folder(self) -> None:
         if not self.items:
             messagebox.showinfo("Export", "No images loaded.")
             return
+        if self._export_busy():
+            return
         out_root = filedialog.askdirectory(title="Choose output root")
         if not out_root:
             return
         ext = self._image_ext()
         model_dir = Path(out_root) / self._auto_export_base_name()
         model_dir.mkdir(parents=True, exist_ok=True)
-        exported = 0
-        errors: list[str] = []
-        for idx, item in enumerate(self.items, start=1):
+        metadata = self._build_pack_metadata_json()
+        total = len(self.items)
+
+        def finish(encoded: list[tuple[str, bytes]], exported: int, errors: list[str]) -> None:
+            # Each file is written on its own, so one locked or unwritable
+            # file does not stop the rest.
+            write_errors: list[str] = []
+            for name, data in encoded:
+                try:
+                    (model_dir / name).write_bytes(data)
+                except Exception as exc:
+                    write_errors.append(f"{name}: {exc}")
+                    if not name.startswith("thumb."):
+                        exported -= 1
             try:
-                out = self._export_sprite_image(item)
-                self._save_encoded(out, model_dir / f"{idx}.{ext}")
-                if idx == 1:
-                    thumb = ImageOps.contain(out, (256, 256), Image.Resampling.LANCZOS)
-                    self._save_encoded(thumb, model_dir / f"thumb.{ext}")
-                exported += 1
+                _dump_json(metadata, model_dir / "metadata.json")
             except Exception as exc:
-                errors.append(f"{item.label()}: {exc}")
+                write_errors.append(f"metadata.json: {exc}")
+            self.status_var.set(f"Exported pack folder: {exported}/{total} images.")
+            if write_errors:
+                messagebox.showerror("Export", "Failed to write:\n" + "\n".join(write_errors[:10]))
+            if errors:
+                messagebox.showwarning("Export warnings", "\n".join(errors[:10]))
 
-        with (model_dir / "metadata.json").open("w", encoding="utf-8") as f:
-            json.dump(self._build_pack_metadata_json(), f, indent=2, ensure_ascii=True)
-        self.status_var.set(f"Exported pack folder: {exported}/{len(self.items)} images.")
-        if errors:
-            messagebox.showwarning("Export warnings", "\n".join(errors[:10]))
+        self._start_export_jobs(ext, finish)
 
     def _export_zip(self) -> None:
         if not self.items:
             messagebox.showinfo("Export", "No images loaded.")
             return
+        if self._export_busy():
+            return
         out_zip = filedialog.asksaveasfilename(
             title="Save pack zip",
             filetypes=[("Zip files", "*.zip")],
@@ -2958,26 +4348,32 @@ class SpritePipelineApp(BaseTk):
             return
         ext = self._image_ext()
         folder = self._auto_export_base_name()
-        exported = 0
-        errors: list[str] = []
-        with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for idx, item in enumerate(self.items, start=1):
-                try:
-                    out = self._export_sprite_image(item)
-                    zf.writestr(f"{folder}/{idx}.{ext}", self._encode_bytes(out, ext))
-                    if idx == 1:
-                        thumb = ImageOps.contain(out, (256, 256), Image.Resampling.LANCZOS)
-                        zf.writestr(f"{folder}/thumb.{ext}", self._encode_bytes(thumb, ext))
-                    exported += 1
-                except Exception as exc:
-                    errors.append(f"{item.label()}: {exc}")
-            zf.writestr(
-                f"{folder}/metadata.json",
-                json.dumps(self._build_pack_metadata_json(), indent=2, ensure_ascii=True).encode("utf-8"),
-            )
-        self.status_var.set(f"Exported pack zip: {exported}/{len(self.items)} images.")
-        if errors:
-            messagebox.showwarning("Export warnings", "\n".join(errors[:10]))
+        metadata = self._build_pack_metadata_json()
+        total = len(self.items)
+
+        def finish(encoded: list[tuple[str, bytes]], exported: int, errors: list[str]) -> None:
+            # WebP/PNG payloads are already compressed; deflating them again costs
+            # CPU for no size win, so only metadata.json may be deflated.
+            payload = _encode_json_bytes(metadata)
+            try:
+                with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_STORED) as zf:
+                    for name, data in encoded:
+                        zf.writestr(f"{folder}/{name}", data)
+                    zf.writestr(
+                        f"{folder}/metadata.json",
+                        payload,
+                        compress_type=_metadata_compress_type(payload),
+                        compresslevel=1,
+                    )
+            except Exception as exc:
+                self.status_var.set("Pack zip export failed.")
+                messagebox.showerror("Export", f"Failed to write pack zip:\n{exc}")
+                return
+            self.status_var.set(f"Exported pack zip: {exported}/{total} images.")
+            if errors:
+                messagebox.showwarning("Export warnings", "\n".join(errors[:10]))
+
+        self._start_export_jobs(ext, finish)
 
 
 def main() -> int:
@@ -2987,4 +4383,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Export runs in a process pool; frozen Windows builds need this before
+    # any worker is spawned.
+    multiprocessing.freeze_support()
     sys.exit(main())